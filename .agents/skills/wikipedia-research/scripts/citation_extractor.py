@@ -7,11 +7,25 @@ Maps claims to their supporting citations for AI verification.
 
 import re
 import json
+import hashlib
+from bisect import bisect_left
+from functools import lru_cache
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from html import unescape
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+from pathlib import Path
 from html.parser import HTMLParser
 from dataclasses import dataclass, asdict
 
+import requests
+
+# Optional fast JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import local client
 try:
     from .wikipedia_client import WikipediaClient
@@ -19,7 +33,54 @@ except ImportError:
     from wikipedia_client import WikipediaClient
 
 
-@dataclass
+# Precompiled patterns (avoid per-call compilation and re cache lookups)
+# Opening tag (not self-closing) then content up to the first </ref>, written
+# as an unrolled loop rather than a lazy DOTALL scan to avoid backtracking
+_REF_RE = re.compile(
+    r'<ref\b([^>]*)(?<!/)>([^<]*(?:<(?!/ref>)[^<]*)*)</ref>',
+    re.IGNORECASE
+)
+_REF_NAME_RE = re.compile(r'(?:^|\s)name\s*=\s*["\']?([^"\'>\s]+)', re.IGNORECASE)
+_TEMPLATE_TOKEN_RE = re.compile(r'\{\{|\}\}|\[\[|\]\]|\|')
+_PARAM_KEY_RE = re.compile(r'[a-zA-Z0-9_-]+')
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_HEADING_RE = re.compile(r'<h[23][^>]*>')
+# Zero-width after '<span' so nested spans are all visited; group 1 holds the
+# attributes and group 2 runs to the closing tag
+_ANCHOR_RE = re.compile(r'<span(?=([^>]*)(>.*?</span>))', re.IGNORECASE)
+_ID_ATTR_RE = re.compile(r'id="([^"]+)"', re.IGNORECASE)
+_CITATION_SUP_RE = re.compile(r'([^.!?]*?)\s*<sup[^>]*class="reference"[^>]*>.*?</sup>')
+_CITE_NOTE_RE = re.compile(r'#cite_note-([^"]+)')
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+_TEMPLATE_TYPE_RE = re.compile(
+    r'\{\{\s*(cite\s+web|cite\s+news|cite\s+journal|cite\s+book|cite\s+magazine|'
+    r'cite\s+conference|cite\s+encyclopedia|cite\s+thesis|cite\s+report|'
+    r'cite\s+press\s+release|cite\s+arXiv|cite\s+AV\s+media|citation)\b',
+    re.IGNORECASE
+)
+
+# Citation date formats as (pattern, number of date parts), tried in order.
+# Equivalent to strptime with %Y-%m-%d, %B %d, %Y, %d %B %Y, %Y-%m, %B %Y, %Y
+# but without strptime's per-call format parsing and locale lookups.
+_DATE_FORMATS = (
+    (re.compile(r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})'), 3),
+    (re.compile(r'(?P<month_name>[a-z]+)\s+(?P<day>\d{1,2}),\s+(?P<year>\d{4})', re.IGNORECASE), 3),
+    (re.compile(r'(?P<day>\d{1,2})\s+(?P<month_name>[a-z]+)\s+(?P<year>\d{4})', re.IGNORECASE), 3),
+    (re.compile(r'(?P<year>\d{4})-(?P<month>\d{1,2})'), 2),
+    (re.compile(r'(?P<month_name>[a-z]+)\s+(?P<year>\d{4})', re.IGNORECASE), 2),
+    (re.compile(r'(?P<year>\d{4})'), 1),
+)
+_MONTHS = {
+    name: number for number, name in enumerate((
+        'january', 'february', 'march', 'april', 'may', 'june', 'july',
+        'august', 'september', 'october', 'november', 'december'
+    ), start=1)
+}
+
+
+@dataclass(slots=True)
 class Citation:
     """Structured citation in CSL-JSON compatible format."""
     id: str
@@ -43,7 +104,7 @@ class Citation:
     raw_citation: Optional[str] = None  # Original wikitext
 
 
-@dataclass
+@dataclass(slots=True)
 class Claim:
     """A factual claim with its supporting citations."""
     text: str
@@ -52,7 +113,7 @@ class Claim:
     confidence: float = 0.0  # 0-1, based on citation quality
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Article section with content and claims."""
     heading: str
@@ -88,11 +149,47 @@ class CitationExtractor:
         'cite AV media': 'broadcast',
         'citation': 'article'
     }
+    _TYPE_MAP_LOWER = {name.lower(): csl_type for name, csl_type in TYPE_MAP.items()}
+
+    # Optional Citation attributes and their CSL-JSON keys, in output order
+    _CSL_FIELDS = (
+        ('title', 'title'),
+        ('author', 'author'),
+        ('URL', 'URL'),
+        ('DOI', 'DOI'),
+        ('ISBN', 'ISBN'),
+        ('PMID', 'PMID'),
+        ('issued', 'issued'),
+        ('accessed', 'accessed'),
+        ('publisher', 'publisher'),
+        ('container_title', 'container-title'),
+        ('volume', 'volume'),
+        ('issue', 'issue'),
+        ('page', 'page'),
+        ('quote', 'quote'),
+        ('archive_url', 'archive-URL'),
+    )
+
+    def __init__(
+        self,
+        language: str = "en",
+        cache_dir: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Initialize extractor with Wikipedia client.
 
-    def __init__(self, language: str = "en"):
-        """Initialize extractor with Wikipedia client."""
-        self.client = WikipediaClient(language=language)
+        Args:
+            language: Wikipedia language code
+            cache_dir: Directory for caching extracted articles (None to disable)
+            session: HTTP session to share with other clients (None for its own)
+        """
+        self.client = WikipediaClient(language=language, session=session)
         self.language = language
+        self.cache_dir = Path(cache_dir) / "articles" if cache_dir else None
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def extract_article(self, title: str) -> Dict[str, Any]:
         """
@@ -104,9 +201,51 @@ class CitationExtractor:
         Returns:
             Structured research data with sections, claims, and citations
         """
+        cached, article = self._fetch_article(title)
+        if cached:
+            return cached
+
+        result = self._build_result(article)
+
+        if self.cache_dir:
+            self._save_cached_article(title, result)
+
+        return result
+
+    def _fetch_article(self, title: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        Fetch an article for extraction, or its cached extraction.
+
+        Args:
+            title: Wikipedia article title
+
+        Returns:
+            (cached extraction, None) if the article is unchanged since it was
+            cached, otherwise (None, article with wikitext)
+        """
+        # Serve the cached extraction if the article is unchanged; with no
+        # cache file there is nothing to serve, so skip the revision probe
+        if self.cache_dir and self._article_cache_file(title).exists():
+            revid = self.client.get_revision_info(title).get('revid')
+            cached = self._get_cached_article(title, revid)
+            if cached:
+                return cached, None
+
         # Get article with wikitext for citation parsing
-        article = self.client.get_article(title, include_wikitext=True)
+        return None, self.client.get_article(title, include_wikitext=True)
+
+    def _build_result(self, article: Dict) -> Dict[str, Any]:
+        """
+        Parse a fetched article into the extract_article structure.
+
+        Needs no network access, so it can run in a worker process.
 
+        Args:
+            article: Article data from WikipediaClient.get_article
+
+        Returns:
+            Structured research data with sections, claims, and citations
+        """
         # Extract citations from wikitext
         citations = self._extract_citations_from_wikitext(article.get('wikitext', ''))
 
@@ -117,13 +256,16 @@ class CitationExtractor:
             citations
         )
 
+        # One timestamp for the whole extraction, preferring the fetch time
+        extracted_at = article.get('extracted_at') or datetime.now().isoformat()
+
         # Build output structure
-        return {
+        result = {
             "article": {
                 "title": article['title'],
                 "url": article['url'],
                 "revision_id": str(article.get('revid', '')),
-                "extracted_at": article.get('extracted_at', datetime.now().isoformat()),
+                "extracted_at": extracted_at,
                 "language": self.language,
                 "categories": article.get('categories', [])
             },
@@ -134,7 +276,7 @@ class CitationExtractor:
                 "source_url": article['url'],
                 "extraction_method": "MediaWiki API + wikitext parsing",
                 "skill_version": "1.0",
-                "extracted_at": datetime.now().isoformat()
+                "extracted_at": extracted_at
             },
             "metadata": {
                 "total_citations": len(citations),
@@ -143,6 +285,106 @@ class CitationExtractor:
             }
         }
 
+        return result
+
+    def extract_articles(
+        self,
+        titles: List[str],
+        max_workers: int = 8,
+        parse_workers: Optional[int] = None,
+        parse_pool: Optional[Executor] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract several articles, parsing them concurrently.
+
+        Fetches run on a thread pool but gain little from it: the client's
+        rate limit spaces request starts rate_limit seconds apart (1 s by
+        default), so requests only overlap when one takes longer than that,
+        and responses from the client's cache are the main thing the threads
+        speed up. Each article is a separate parse request, which cannot be
+        batched like page queries. Parsing is CPU-bound and is where the
+        concurrency pays off: fetched articles are parsed on a process pool.
+
+        Args:
+            titles: Wikipedia article titles
+            max_workers: Maximum concurrent fetches (still subject to the
+                client's rate limit)
+            parse_workers: Parser processes (None for one per CPU, 1 to
+                parse in this process)
+            parse_pool: Long-lived process pool to parse on instead of
+                starting one per call (parse_workers is then ignored unless 1)
+
+        Returns:
+            Dictionary mapping each successfully extracted title (in input
+            order) to the same structure extract_article returns
+        """
+        titles = list(dict.fromkeys(titles))
+        results = {}
+        articles = {}
+
+        # Fetch phase
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(self._fetch_article, t): t for t in titles}
+            for future in as_completed(futures):
+                title = futures[future]
+                try:
+                    cached, article = future.result()
+                except Exception as e:
+                    print(f"Error processing {title}: {e}")
+                    continue
+
+                if cached:
+                    results[title] = cached
+                else:
+                    articles[title] = article
+
+        # Parse phase
+        if parse_workers == 1 or len(articles) <= 1:
+            parsed = self._parse_articles_inline(articles)
+        else:
+            parsed = self._parse_articles_pooled(articles, parse_workers, parse_pool)
+
+        for title, result in parsed:
+            results[title] = result
+            if self.cache_dir:
+                self._save_cached_article(title, result)
+
+        return {t: results[t] for t in titles if t in results}
+
+    def _parse_articles_inline(
+        self,
+        articles: Dict[str, Dict]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Parse fetched articles in this process, yielding (title, result)."""
+        for title, article in articles.items():
+            try:
+                yield title, self._build_result(article)
+            except Exception as e:
+                print(f"Error processing {title}: {e}")
+
+    def _parse_articles_pooled(
+        self,
+        articles: Dict[str, Dict],
+        workers: Optional[int],
+        pool: Optional[Executor] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Parse fetched articles on a process pool, yielding (title, result)."""
+        if pool is None:
+            with ProcessPoolExecutor(max_workers=workers) as own_pool:
+                yield from self._parse_articles_pooled(articles, workers, own_pool)
+            return
+
+        futures = {
+            pool.submit(_parse_article, (self.language, article)): title
+            for title, article in articles.items()
+        }
+        for future in as_completed(futures):
+            title = futures[future]
+            try:
+                yield title, future.result()
+            except Exception as e:
+                print(f"Error processing {title}: {e}")
+
     def extract_citations(self, title: str) -> List[Dict]:
         """
         Extract only citations from an article.
@@ -157,6 +399,29 @@ class CitationExtractor:
         citations = self._extract_citations_from_wikitext(article.get('wikitext', ''))
         return [self._citation_to_csl(c) for c in citations.values()]
 
+    def extract_citations_bulk(self, titles: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Extract only citations from several articles.
+
+        Fetches the articles' wikitext in batched queries (up to
+        WikipediaClient.MAX_TITLES_PER_QUERY titles per request) rather than
+        one request per article.
+
+        Args:
+            titles: Wikipedia article titles
+
+        Returns:
+            Dictionary mapping each existing title (in input order) to its
+            citations in CSL-JSON format
+        """
+        return {
+            title: [
+                self._citation_to_csl(c)
+                for c in self._extract_citations_from_wikitext(wikitext).values()
+            ]
+            for title, wikitext in self.client.get_wikitexts(titles).items()
+        }
+
     def extract_section(self, title: str, section_name: str) -> Optional[Dict]:
         """
         Extract a specific section with its citations.
@@ -191,6 +456,47 @@ class CitationExtractor:
 
         return None
 
+    def _article_cache_file(self, title: str) -> Path:
+        """Cache file path for an extracted article, shared by variants of its title."""
+        # As MediaWiki normalizes titles: spaces for underscores, first letter capitalized
+        title = title.replace('_', ' ').strip()
+        title = title[:1].upper() + title[1:]
+        return self.cache_dir / f"{hashlib.sha1(title.encode()).hexdigest()}.json"
+
+    def _get_cached_article(self, title: str, revid: Optional[int]) -> Optional[Dict]:
+        """Retrieve cached extraction if it matches the current revision."""
+        if not revid:
+            return None
+
+        cache_file = self._article_cache_file(title)
+        if not cache_file.exists():
+            return None
+
+        try:
+            raw = cache_file.read_bytes()
+            cached = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+            if cached['revision_id'] != str(revid):
+                return None
+
+            return cached['data']
+        except (OSError, ValueError, KeyError, TypeError):
+            # Unreadable, truncated or malformed files count as a miss
+            # (ValueError covers bad JSON and UTF-8)
+            return None
+
+    def _save_cached_article(self, title: str, data: Dict):
+        """Save extracted article keyed by its revision."""
+        entry = {
+            'revision_id': data['article']['revision_id'],
+            'data': data
+        }
+        if orjson is not None:
+            raw = orjson.dumps(entry)
+        else:
+            raw = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        self._article_cache_file(title).write_bytes(raw)
+
     def _extract_citations_from_wikitext(self, wikitext: str) -> Dict[str, Citation]:
         """
         Parse wikitext to extract all citations.
@@ -203,11 +509,9 @@ class CitationExtractor:
         """
         citations = {}
 
-        # Pattern to match <ref> tags
-        ref_pattern = r'<ref(?:\s+name\s*=\s*["\']?([^"\'>\s]+)["\']?)?[^>]*>(.*?)</ref>'
-
-        for match in re.finditer(ref_pattern, wikitext, re.DOTALL | re.IGNORECASE):
-            ref_name = match.group(1)
+        for match in _REF_RE.finditer(wikitext):
+            name_match = _REF_NAME_RE.search(match.group(1))
+            ref_name = name_match.group(1) if name_match else None
             ref_content = match.group(2).strip()
 
             # Generate ID
@@ -224,10 +528,6 @@ class CitationExtractor:
             citation = self._parse_citation_template(ref_content, ref_id)
             citations[ref_id] = citation
 
-        # Also find named ref usage (refs that just reference existing)
-        # Pattern: <ref name="xxx" /> or <ref name="xxx"/>
-        named_ref_pattern = r'<ref\s+name\s*=\s*["\']?([^"\'>/\s]+)["\']?\s*/>'
-
         return citations
 
     def _parse_citation_template(self, content: str, ref_id: str) -> Citation:
@@ -243,10 +543,10 @@ class CitationExtractor:
         """
         # Detect template type
         template_type = 'article'  # default
-        for template in self.CITE_TEMPLATES:
-            if template.lower() in content.lower():
-                template_type = self.TYPE_MAP.get(template, 'article')
-                break
+        template_match = _TEMPLATE_TYPE_RE.search(content)
+        if template_match:
+            template = ' '.join(template_match.group(1).lower().split())
+            template_type = self._TYPE_MAP_LOWER.get(template, 'article')
 
         # Extract template parameters
         params = self._extract_template_params(content)
@@ -254,9 +554,15 @@ class CitationExtractor:
         # Parse author(s)
         authors = self._parse_authors(params)
 
-        # Parse date
-        issued = self._parse_date(params.get('date') or params.get('year'))
-        accessed = self._parse_date(params.get('access-date') or params.get('accessdate'))
+        # Parse dates straight through the memoized parser (same result as
+        # _parse_date, without its extra call per date)
+        issued = accessed = None
+        date_str = params.get('date') or params.get('year')
+        if date_str and (date_parts := self._parse_date_parts(date_str)):
+            issued = {'date-parts': [list(date_parts)]}
+        date_str = params.get('access-date') or params.get('accessdate')
+        if date_str and (date_parts := self._parse_date_parts(date_str)):
+            accessed = {'date-parts': [list(date_parts)]}
 
         return Citation(
             id=ref_id,
@@ -292,20 +598,68 @@ class CitationExtractor:
         """
         params = {}
 
-        # Pattern to match |param=value
-        param_pattern = r'\|\s*([a-zA-Z0-9_-]+)\s*=\s*([^|{}]*?)(?=\||}}|$)'
-
-        for match in re.finditer(param_pattern, content, re.DOTALL):
-            key = match.group(1).strip().lower()
-            value = match.group(2).strip()
-            # Clean up wiki markup
-            value = re.sub(r'\[\[([^\]|]+)\|?([^\]]*)\]\]', r'\2' if r'\2' else r'\1', value)
-            value = re.sub(r"'''?", '', value)  # Remove bold/italic
+        # Single pass over the structural tokens ({{ }} [[ ]] |), tracking
+        # nesting so only pipes of the outermost template split parameters.
+        # Pipes inside [[target|label]] links or nested templates stay part
+        # of the value.
+        segments = []
+        depth = 0
+        link_depth = 0
+        seg_start = None
+        for match in _TEMPLATE_TOKEN_RE.finditer(content):
+            token = match.group()
+            if token == '{{':
+                depth += 1
+            elif token == '}}':
+                if depth == 1 and seg_start is not None:
+                    segments.append((seg_start, match.start()))
+                    seg_start = None
+                depth = max(depth - 1, 0)
+            elif token == '[[':
+                link_depth += 1
+            elif token == ']]':
+                link_depth = max(link_depth - 1, 0)
+            elif depth == 1 and link_depth == 0:
+                if seg_start is not None:
+                    segments.append((seg_start, match.start()))
+                seg_start = match.end()
+        if seg_start is not None:
+            segments.append((seg_start, len(content)))
+
+        for start, end in segments:
+            key, sep, value = content[start:end].partition('=')
+            key = key.strip()
+            if not sep or not _PARAM_KEY_RE.fullmatch(key):
+                continue  # positional parameter
+            key = key.lower()
+            value = value.strip()
+            # Clean up wiki markup with plain string ops
+            if '[[' in value:
+                value = self._strip_wikilinks(value)
+            if "''" in value:
+                value = value.replace("'''", '').replace("''", '')  # Remove bold/italic
             if value:
                 params[key] = value
 
         return params
 
+    @staticmethod
+    def _strip_wikilinks(value: str) -> str:
+        """Replace [[target|label]] with its label and [[target]] with its target."""
+        parts = []
+        pos = 0
+        while True:
+            start = value.find('[[', pos)
+            end = value.find(']]', start + 2) if start >= 0 else -1
+            if end < 0:
+                break
+            target, _, label = value[start + 2:end].partition('|')
+            parts.append(value[pos:start])
+            parts.append(label or target)
+            pos = end + 2
+        parts.append(value[pos:])
+        return ''.join(parts)
+
     def _parse_authors(self, params: Dict[str, str]) -> List[Dict[str, str]]:
         """Parse author information from template params."""
         authors = []
@@ -349,32 +703,44 @@ class CitationExtractor:
         if not date_str:
             return None
 
-        # Try different date formats
-        formats = [
-            ('%Y-%m-%d', 3),  # 2024-01-15
-            ('%B %d, %Y', 3),  # January 15, 2024
-            ('%d %B %Y', 3),  # 15 January 2024
-            ('%Y-%m', 2),  # 2024-01
-            ('%B %Y', 2),  # January 2024
-            ('%Y', 1),  # 2024
-        ]
-
-        for fmt, parts_count in formats:
+        date_parts = self._parse_date_parts(date_str)
+        if date_parts:
+            # Fresh dict per call so cached results are never shared/mutated
+            return {'date-parts': [list(date_parts)]}
+
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_date_parts(date_str: str) -> Optional[Tuple[int, ...]]:
+        """Parse date string into (year[, month[, day]]), memoized per string."""
+        stripped = date_str.strip()
+
+        # Dispatch on precompiled format patterns
+        for pattern, parts_count in _DATE_FORMATS:
+            match = pattern.fullmatch(stripped)
+            if not match:
+                continue
+
+            fields = match.groupdict()
+            if 'month_name' in fields:
+                month = _MONTHS.get(fields['month_name'].lower())
+                if month is None:
+                    continue
+            else:
+                month = int(fields.get('month', 1))
+            date_parts = (int(fields['year']), month, int(fields.get('day', 1)))
+
             try:
-                dt = datetime.strptime(date_str.strip(), fmt)
-                date_parts = [dt.year]
-                if parts_count >= 2:
-                    date_parts.append(dt.month)
-                if parts_count >= 3:
-                    date_parts.append(dt.day)
-                return {'date-parts': [date_parts]}
+                datetime(*date_parts)  # Reject out-of-range values like strptime
             except ValueError:
                 continue
+            return date_parts[:parts_count]
 
         # If we can extract just a year
-        year_match = re.search(r'\b(19|20)\d{2}\b', date_str)
+        year_match = _YEAR_RE.search(date_str)
         if year_match:
-            return {'date-parts': [[int(year_match.group())]]}
+            return (int(year_match.group()),)
 
         return None
 
@@ -397,20 +763,56 @@ class CitationExtractor:
         """
         sections = []
 
+        # Score each citation once; claims then just average the scores
+        citation_scores = {cid: self._score_citation(c) for cid, c in citations.items()}
+
+        # Index h2/h3 offsets once so each section is a slice, not a rescan
+        heading_starts = []
+        if '<h2' in html or '<h3' in html:
+            heading_starts = [m.start() for m in _HEADING_RE.finditer(html)]
+
+        # Map each span id to where its first span ends, for section lookup
+        anchor_ends = {}
+        for match in _ANCHOR_RE.finditer(html):
+            for anchor in _ID_ATTR_RE.findall(match.group(1)):
+                anchor_ends.setdefault(anchor.lower(), match.end(2))
+
+        # Find citation markers once for the whole article; each section
+        # then takes its share by offset. Skip the scan (and its backtracking)
+        # when the article has no markers at all.
+        sup_matches = []
+        if 'class="reference"' in html:
+            sup_matches = list(_CITATION_SUP_RE.finditer(html))
+        sup_starts = [m.start() for m in sup_matches]
+
         # Add lead section
-        lead_content = self._extract_lead_section(html)
-        lead_claims = self._extract_claims(lead_content, citations)
+        lead_start, lead_end = self._locate_lead_section(html, heading_starts)
+        lead_claims = self._extract_claims(
+            self._section_matches(html, lead_start, lead_end, sup_matches, sup_starts),
+            citation_scores
+        )
         sections.append(Section(
             heading="Introduction",
             level=1,
-            content=self._clean_html(lead_content),
+            content=self._clean_html(html[lead_start:lead_end]),
             claims=lead_claims
         ))
 
         # Process each section
         for sec in section_info:
-            section_html = self._extract_section_html(html, sec.get('anchor', ''))
-            section_claims = self._extract_claims(section_html, citations)
+            bounds = self._locate_section(
+                html, sec.get('anchor', ''), anchor_ends, heading_starts
+            )
+            if bounds:
+                start, end = bounds
+                section_html = html[start:end]
+                section_claims = self._extract_claims(
+                    self._section_matches(html, start, end, sup_matches, sup_starts),
+                    citation_scores
+                )
+            else:
+                section_html = ""
+                section_claims = []
 
             sections.append(Section(
                 heading=sec.get('line', 'Unknown'),
@@ -421,72 +823,88 @@ class CitationExtractor:
 
         return sections
 
-    def _extract_lead_section(self, html: str) -> str:
-        """Extract content before first heading."""
-        # Find first h2 or h3
-        match = re.search(r'<h[23][^>]*>', html)
-        if match:
-            return html[:match.start()]
-        return html[:5000]  # Limit if no heading found
+    def _locate_lead_section(self, html: str, heading_starts: List[int]) -> Tuple[int, int]:
+        """Locate content before first heading as (start, end) offsets."""
+        if heading_starts:
+            return 0, heading_starts[0]
+        return 0, min(len(html), 5000)  # Limit if no heading found
 
-    def _extract_section_html(self, html: str, anchor: str) -> str:
-        """Extract HTML for a specific section."""
+    def _locate_section(
+        self,
+        html: str,
+        anchor: str,
+        anchor_ends: Dict[str, int],
+        heading_starts: List[int]
+    ) -> Optional[Tuple[int, int]]:
+        """Locate HTML for a specific section as (start, end) offsets."""
         if not anchor:
-            return ""
-
-        # Find section start
-        pattern = rf'<span[^>]*id="{re.escape(anchor)}"[^>]*>.*?</span>'
-        match = re.search(pattern, html, re.IGNORECASE)
+            return None
 
-        if not match:
-            return ""
+        # Section starts after its anchor span
+        start = anchor_ends.get(anchor.lower())
 
-        start = match.end()
+        if start is None:
+            return None
 
         # Find next heading of same or higher level
-        next_heading = re.search(r'<h[23][^>]*>', html[start:])
-        if next_heading:
-            end = start + next_heading.start()
-        else:
-            end = len(html)
+        i = bisect_left(heading_starts, start)
+        end = heading_starts[i] if i < len(heading_starts) else len(html)
+
+        return start, end
 
-        return html[start:end]
+    def _section_matches(
+        self,
+        html: str,
+        start: int,
+        end: int,
+        sup_matches: List[re.Match],
+        sup_starts: List[int]
+    ) -> List[re.Match]:
+        """Select the article-level citation marker matches for html[start:end]."""
+        i = bisect_left(sup_starts, start)
+        j = bisect_left(sup_starts, end)
+
+        # A match crossing a section boundary would come out differently if
+        # the section were scanned on its own, so rescan just that section
+        if (i > 0 and sup_matches[i - 1].end() > start) or (j > i and sup_matches[j - 1].end() > end):
+            if html.find('class="reference"', start, end) == -1:
+                return []
+            return list(_CITATION_SUP_RE.finditer(html, start, end))
+
+        return sup_matches[i:j]
 
     def _extract_claims(
         self,
-        content: str,
-        citations: Dict[str, Citation]
+        matches: List[re.Match],
+        citation_scores: Dict[str, float]
     ) -> List[Claim]:
         """
         Extract factual claims and map to citations.
 
         Args:
-            content: HTML content
-            citations: Available citations
+            matches: Citation marker matches within one section
+            citation_scores: Quality score per available citation ID
 
         Returns:
             List of Claim objects
         """
         claims = []
 
-        # Pattern to find sentences with citation markers
-        # Look for text followed by citation reference
-        citation_pattern = r'([^.!?]*?)\s*<sup[^>]*class="reference"[^>]*>.*?</sup>'
-
-        for match in re.finditer(citation_pattern, content):
+        # Sentences followed by citation markers
+        for match in matches:
             claim_text = self._clean_html(match.group(1)).strip()
 
             if len(claim_text) < 10:  # Skip very short fragments
                 continue
 
             # Find citation IDs referenced
-            ref_links = re.findall(r'#cite_note-([^"]+)', match.group(0))
+            ref_links = _CITE_NOTE_RE.findall(match.group(0))
 
             citation_ids = []
             for ref_link in ref_links:
                 # Try to match to our extracted citations
                 possible_id = f"ref_{self._sanitize_id(ref_link)}"
-                if possible_id in citations:
+                if possible_id in citation_scores:
                     citation_ids.append(possible_id)
                 else:
                     # Fallback: create generic ID
@@ -494,7 +912,7 @@ class CitationExtractor:
 
             if claim_text and citation_ids:
                 # Calculate confidence based on citation quality
-                confidence = self._calculate_confidence(citation_ids, citations)
+                confidence = self._calculate_confidence(citation_ids, citation_scores)
 
                 claims.append(Claim(
                     text=claim_text,
@@ -508,14 +926,14 @@ class CitationExtractor:
     def _calculate_confidence(
         self,
         citation_ids: List[str],
-        citations: Dict[str, Citation]
+        citation_scores: Dict[str, float]
     ) -> float:
         """
         Calculate confidence score based on citation quality.
 
         Args:
             citation_ids: IDs of supporting citations
-            citations: All citations
+            citation_scores: Precomputed quality score per citation ID
 
         Returns:
             Confidence score 0-1
@@ -523,60 +941,51 @@ class CitationExtractor:
         if not citation_ids:
             return 0.0
 
-        scores = []
-        for cid in citation_ids:
-            citation = citations.get(cid)
-            if not citation:
-                scores.append(0.3)
-                continue
-
-            score = 0.5  # Base score
+        # Unknown citations count as weak support
+        return sum(citation_scores.get(cid, 0.3) for cid in citation_ids) / len(citation_ids)
 
-            # Boost for DOI (peer-reviewed)
-            if citation.DOI:
-                score += 0.2
+    def _score_citation(self, citation: Citation) -> float:
+        """Score a single citation's quality (0-1)."""
+        score = 0.5  # Base score
 
-            # Boost for PMID (medical/scientific)
-            if citation.PMID:
-                score += 0.15
+        # Boost for DOI (peer-reviewed)
+        if citation.DOI:
+            score += 0.2
 
-            # Boost for ISBN (book)
-            if citation.ISBN:
-                score += 0.1
+        # Boost for PMID (medical/scientific)
+        if citation.PMID:
+            score += 0.15
 
-            # Boost for URL (verifiable)
-            if citation.URL:
-                score += 0.05
+        # Boost for ISBN (book)
+        if citation.ISBN:
+            score += 0.1
 
-            # Boost for author information
-            if citation.author:
-                score += 0.1
+        # Boost for URL (verifiable)
+        if citation.URL:
+            score += 0.05
 
-            # Boost for publication info
-            if citation.container_title:
-                score += 0.05
+        # Boost for author information
+        if citation.author:
+            score += 0.1
 
-            scores.append(min(score, 1.0))
+        # Boost for publication info
+        if citation.container_title:
+            score += 0.05
 
-        return sum(scores) / len(scores)
+        return min(score, 1.0)
 
     def _clean_html(self, html: str) -> str:
         """Remove HTML tags and clean text."""
-        # Remove tags
-        text = re.sub(r'<[^>]+>', '', html)
-        # Decode entities
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        # Clean whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
-
-    def _sanitize_id(self, text: str) -> str:
+        # Remove tags, decode all entities in one pass, then collapse whitespace
+        # (&nbsp; decodes to U+00A0, which \s also matches)
+        text = unescape(_TAG_RE.sub('', html))
+        return _WS_RE.sub(' ', text).strip()
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _sanitize_id(text: str) -> str:
         """Sanitize string for use as ID."""
-        return re.sub(r'[^a-zA-Z0-9_-]', '_', text)[:50]
+        return _SANITIZE_RE.sub('_', text)[:50]
 
     def _section_to_dict(self, section: Section) -> Dict:
         """Convert Section to dictionary."""
@@ -601,40 +1010,36 @@ class CitationExtractor:
             'type': citation.type
         }
 
-        if citation.title:
-            result['title'] = citation.title
-        if citation.author:
-            result['author'] = citation.author
-        if citation.URL:
-            result['URL'] = citation.URL
-        if citation.DOI:
-            result['DOI'] = citation.DOI
-        if citation.ISBN:
-            result['ISBN'] = citation.ISBN
-        if citation.PMID:
-            result['PMID'] = citation.PMID
-        if citation.issued:
-            result['issued'] = citation.issued
-        if citation.accessed:
-            result['accessed'] = citation.accessed
-        if citation.publisher:
-            result['publisher'] = citation.publisher
-        if citation.container_title:
-            result['container-title'] = citation.container_title
-        if citation.volume:
-            result['volume'] = citation.volume
-        if citation.issue:
-            result['issue'] = citation.issue
-        if citation.page:
-            result['page'] = citation.page
-        if citation.quote:
-            result['quote'] = citation.quote
-        if citation.archive_url:
-            result['archive-URL'] = citation.archive_url
+        # Only emit fields that are set
+        result.update(
+            (key, value) for attr, key in self._CSL_FIELDS
+            if (value := getattr(citation, attr))
+        )
 
         return result
 
 
+# Per-process parsers for extract_articles workers, keyed by language
+_worker_parsers: Dict[str, CitationExtractor] = {}
+
+
+def _parse_article(payload: Tuple[str, Dict]) -> Dict[str, Any]:
+    """
+    Parse one fetched article in a worker process.
+
+    Args:
+        payload: (language, article data from WikipediaClient.get_article)
+
+    Returns:
+        Same structure as CitationExtractor.extract_article
+    """
+    language, article = payload
+    parser = _worker_parsers.get(language)
+    if parser is None:
+        parser = _worker_parsers[language] = CitationExtractor(language=language)
+    return parser._build_result(article)
+
+
 if __name__ == "__main__":
     # Example usage
     extractor = CitationExtractor()
@@ -6,10 +6,13 @@ Builds timelines and knowledge graphs for comprehensive research.
 """
 
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter
+from operator import attrgetter
 
 try:
     from .wikipedia_client import WikipediaClient
@@ -17,18 +20,28 @@ except ImportError:
     from wikipedia_client import WikipediaClient
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """A named entity extracted from research."""
     name: str
     entity_type: str  # person, organization, place, concept, publication
     wikipedia_url: Optional[str] = None
     wikidata_id: Optional[str] = None
-    mentions: List[Dict] = field(default_factory=list)  # [{section, context}]
+    # Mentions as parallel lists: section heading and matched context
+    mention_sections: List[str] = field(default_factory=list)
+    mention_contexts: List[str] = field(default_factory=list)
     attributes: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def mentions(self) -> List[Dict[str, str]]:
+        """Mentions as [{section, context}] dicts (built on access)."""
+        return [
+            {'section': section, 'context': context}
+            for section, context in zip(self.mention_sections, self.mention_contexts)
+        ]
+
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     """A relationship between two entities."""
     source: str  # Entity name
@@ -38,7 +51,7 @@ class Relationship:
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineEvent:
     """An event in a timeline."""
     date: str  # ISO date or "YYYY" or "YYYY-MM"
@@ -53,25 +66,33 @@ class TimelineEvent:
 class EntityExtractor:
     """Extract entities, relationships, and timelines from research data."""
 
-    # Entity type patterns
+    # Entity type patterns (compiled once at class definition)
     PERSON_INDICATORS = [
-        r'\b(?:Dr\.?|Prof\.?|Professor)\s+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)',
-        r'\b([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)(?:\s+(?:and|with|,))',
+        re.compile(r'\b(?:Dr\.?|Prof\.?|Professor)\s+([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)'),
+        re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z]\.?)?\s+[A-Z][a-z]+)(?:\s+(?:and|with|,))'),
     ]
 
     ORGANIZATION_PATTERNS = [
-        r'((?:University|Institute|College|School|Laboratory|Lab|Center|Centre)\s+(?:of\s+)?[A-Z][A-Za-z\s]+)',
-        r'([A-Z][A-Za-z]+\s+(?:University|Institute|College|School|Laboratory|Lab|Center|Centre))',
-        r'(Harvard\s+Medical\s+School)',
-        r'(Broad\s+Institute)',
-        r'(MIT|NIH|NSF|ISCB)',
+        re.compile(r'((?:University|Institute|College|School|Laboratory|Lab|Center|Centre)\s+(?:of\s+)?[A-Z][A-Za-z\s]+)'),
+        re.compile(r'([A-Z][A-Za-z]+\s+(?:University|Institute|College|School|Laboratory|Lab|Center|Centre))'),
+        re.compile(r'(Harvard\s+Medical\s+School)'),
+        re.compile(r'(Broad\s+Institute)'),
+        re.compile(r'(MIT|NIH|NSF|ISCB)'),
     ]
 
     PUBLICATION_PATTERNS = [
-        r'(?:published\s+in|journal|appeared\s+in)\s+([A-Z][A-Za-z\s&]+)',
-        r'(Nature|Science|Cell|PNAS|PLoS\s+ONE|eLife|Nature\s+Biotechnology)',
+        re.compile(r'(?:published\s+in|journal|appeared\s+in)\s+([A-Z][A-Za-z\s&]+)', re.IGNORECASE),
+        re.compile(r'(Nature|Science|Cell|PNAS|PLoS\s+ONE|eLife|Nature\s+Biotechnology)', re.IGNORECASE),
     ]
 
+    # Entity types and their patterns, in extraction order; each pattern
+    # scans the text separately, so overlapping matches are all kept
+    ENTITY_PATTERNS = (
+        ('person', PERSON_INDICATORS),
+        ('organization', ORGANIZATION_PATTERNS),
+        ('publication_venue', PUBLICATION_PATTERNS),
+    )
+
     # Relationship indicators
     COLLABORATION_INDICATORS = [
         'collaborator', 'collaborated', 'with', 'and', 'co-author',
@@ -88,9 +109,38 @@ class EntityExtractor:
         'thesis', 'undergraduate', 'doctoral'
     ]
 
+    # Relationship indicator lists by category
+    INDICATOR_CATEGORIES = (
+        ('collaboration', COLLABORATION_INDICATORS),
+        ('employment', EMPLOYMENT_INDICATORS),
+        ('education', EDUCATION_INDICATORS),
+    )
+
+    # Timeline event type keywords, in priority order
+    EVENT_KEYWORDS = {
+        'education': ['degree', 'graduated', 'phd', 'thesis', 'university', 'studied'],
+        'position': ['appointed', 'joined', 'became', 'professor', 'director'],
+        'award': ['awarded', 'received', 'prize', 'fellow', 'honored'],
+        'publication': ['published', 'paper', 'article', 'journal'],
+        'founding': ['founded', 'established', 'created', 'started']
+    }
+
+    # Timeline patterns
+    _YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+    _SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+    # Concurrent search lookups; the client's rate limit still applies
+    MAX_LOOKUP_WORKERS = 8
+
     def __init__(self, language: str = "en"):
         self.client = WikipediaClient(language=language)
         self.language = language
+        self._url_cache: Dict[str, Optional[str]] = {}  # name -> resolved URL
+
+        # Text derived from section content, shared by the public methods
+        # while they work on the same research data
+        self._section_cache: Dict[str, Dict[str, Any]] = {}
+        self._prepared_id: Optional[int] = None
 
     def extract_entities(self, research_data: Dict) -> List[Entity]:
         """
@@ -105,95 +155,132 @@ class EntityExtractor:
         entities = {}
 
         # Process each section
-        for section in research_data.get('sections', []):
+        for section in self._prepare_sections(research_data):
             content = section.get('content', '')
             section_name = section.get('heading', '')
 
-            # Extract different entity types
-            persons = self._extract_persons(content, section_name)
-            orgs = self._extract_organizations(content, section_name)
-            pubs = self._extract_publications(content, section_name)
-
-            # Merge into entities dict
-            for entity in persons + orgs + pubs:
-                if entity.name in entities:
-                    # Merge mentions
-                    entities[entity.name].mentions.extend(entity.mentions)
-                else:
-                    entities[entity.name] = entity
+            self._extract_into(entities, content, section_name)
 
-        # Try to resolve Wikipedia URLs for entities
+        # Try to resolve Wikipedia URLs for entities, reusing earlier lookups
+        unresolved = []
         for entity in entities.values():
             if entity.entity_type == 'person' and not entity.wikipedia_url:
-                entity.wikipedia_url = self._resolve_wikipedia_url(entity.name)
+                if entity.name in self._url_cache:
+                    entity.wikipedia_url = self._url_cache[entity.name]
+                else:
+                    unresolved.append(entity)
+
+        titles = self._resolve_titles([e.name for e in unresolved])
+        to_search = []
+        for entity in unresolved:
+            if entity.name in titles:
+                entity.wikipedia_url = self._wikipedia_url(titles[entity.name])
+                self._url_cache[entity.name] = entity.wikipedia_url
+            else:
+                to_search.append(entity)
+
+        # Names that are not exact article titles fall back to search; the
+        # lookups are network-bound, so overlap them
+        if to_search:
+            with ThreadPoolExecutor(max_workers=self.MAX_LOOKUP_WORKERS) as pool:
+                futures = {
+                    pool.submit(self._resolve_wikipedia_url, e.name): e
+                    for e in to_search
+                }
+                for future in as_completed(futures):
+                    futures[future].wikipedia_url = future.result()
 
         return list(entities.values())
 
-    def _extract_persons(self, text: str, section: str) -> List[Entity]:
-        """Extract person entities from text."""
-        persons = []
-        seen = set()
+    def _extract_into(self, entities: Dict[str, Entity], text: str, section: str):
+        """
+        Extract person, organization and publication venue entities from text.
 
-        for pattern in self.PERSON_INDICATORS:
-            for match in re.finditer(pattern, text):
-                name = match.group(1).strip()
-                if name not in seen and len(name) > 3:
+        Args:
+            entities: Entities by name; new entities are added and mentions of
+                known names are appended, in place
+            text: Section content
+            section: Section heading
+        """
+        for entity_type, patterns in self.ENTITY_PATTERNS:
+            seen = set()  # One mention per name per type per section
+
+            for pattern in patterns:
+                for match in pattern.finditer(text):
+                    name = match.group(1).strip()
+                    if name in seen or len(name) <= 3:
+                        continue
                     seen.add(name)
-                    persons.append(Entity(
-                        name=name,
-                        entity_type='person',
-                        mentions=[{'section': section, 'context': match.group(0)}]
-                    ))
 
-        return persons
+                    entity = entities.get(name)
+                    if entity is None:
+                        entity = entities[name] = Entity(name=name, entity_type=entity_type)
+                    entity.mention_sections.append(section)
+                    entity.mention_contexts.append(match.group(0))
 
-    def _extract_organizations(self, text: str, section: str) -> List[Entity]:
-        """Extract organization entities from text."""
-        orgs = []
-        seen = set()
+    def _prepare_sections(self, research_data: Dict) -> List[Dict]:
+        """
+        Get the sections of research data, starting a fresh section text cache
+        when the research data differs from the previous call's.
 
-        for pattern in self.ORGANIZATION_PATTERNS:
-            for match in re.finditer(pattern, text):
-                name = match.group(1).strip()
-                if name not in seen and len(name) > 3:
-                    seen.add(name)
-                    orgs.append(Entity(
-                        name=name,
-                        entity_type='organization',
-                        mentions=[{'section': section, 'context': match.group(0)}]
-                    ))
+        Args:
+            research_data: Structured research output
 
-        return orgs
+        Returns:
+            The research data's sections
+        """
+        if id(research_data) != self._prepared_id:
+            self._prepared_id = id(research_data)
+            self._section_cache = {}
+        return research_data.get('sections', [])
 
-    def _extract_publications(self, text: str, section: str) -> List[Entity]:
-        """Extract publication venue entities from text."""
-        pubs = []
-        seen = set()
+    def _section_text(self, content: str) -> Dict[str, Any]:
+        """
+        Derive (once per distinct content) what relationship and timeline
+        extraction need from a section's text.
 
-        for pattern in self.PUBLICATION_PATTERNS:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                name = match.group(1).strip()
-                if name not in seen and len(name) > 3:
-                    seen.add(name)
-                    pubs.append(Entity(
-                        name=name,
-                        entity_type='publication_venue',
-                        mentions=[{'section': section, 'context': match.group(0)}]
-                    ))
+        Args:
+            content: Section content
 
-        return pubs
+        Returns:
+            Dictionary with the 'lower'-cased text and the text split into
+            'sentences'; _indicator_categories adds 'categories' on first use
+        """
+        derived = self._section_cache.get(content)
+        if derived is None:
+            derived = self._section_cache[content] = {
+                'lower': content.lower(),
+                'sentences': self._SENTENCE_SPLIT_RE.split(content)
+            }
+        return derived
+
+    def _resolve_titles(self, names: List[str]) -> Dict[str, str]:
+        """Batch-resolve entity names that are article titles."""
+        if not names:
+            return {}
+        try:
+            return self.client.resolve_titles(names)
+        except Exception:
+            return {}  # Every name falls back to search
 
     def _resolve_wikipedia_url(self, name: str) -> Optional[str]:
-        """Try to find Wikipedia URL for an entity."""
+        """Try to find Wikipedia URL for an entity (memoized per name)."""
+        if name in self._url_cache:
+            return self._url_cache[name]
+
         try:
             # Search Wikipedia
             results = self.client.search(name, limit=1)
-            if results:
-                title = results[0]['title']
-                return f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
         except Exception:
-            pass
-        return None
+            return None  # Not cached, so a transient failure can be retried
+
+        url = self._wikipedia_url(results[0]['title']) if results else None
+        self._url_cache[name] = url
+        return url
+
+    def _wikipedia_url(self, title: str) -> str:
+        """Build the Wikipedia URL for an article title."""
+        return f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
 
     def extract_relationships(
         self,
@@ -213,60 +300,88 @@ class EntityExtractor:
             List of relationships
         """
         relationships = []
-        entity_names = {e.name for e in entities}
 
-        for section in research_data.get('sections', []):
+        # Group the candidate entities once instead of filtering per section
+        persons = [
+            e for e in entities
+            if e.entity_type == 'person' and e.name != subject_name
+        ]
+        organizations = [e for e in entities if e.entity_type == 'organization']
+
+        for section in self._prepare_sections(research_data):
             content = section.get('content', '')
 
+            # Indicator categories are found at most once per section, and
+            # only once a candidate name occurs in it
+            derived = self._section_text(content)
+
             # Check for collaborations
-            for entity in entities:
-                if entity.entity_type == 'person' and entity.name != subject_name:
-                    if self._indicates_collaboration(content, entity.name):
-                        relationships.append(Relationship(
-                            source=subject_name,
-                            target=entity.name,
-                            relationship_type='collaborator',
-                            evidence=[f"Mentioned together in {section.get('heading')}"],
-                            confidence=0.7
-                        ))
+            for entity in persons:
+                if self._indicates_collaboration(content, derived, entity.name):
+                    relationships.append(Relationship(
+                        source=subject_name,
+                        target=entity.name,
+                        relationship_type='collaborator',
+                        evidence=[f"Mentioned together in {section.get('heading')}"],
+                        confidence=0.7
+                    ))
 
             # Check for employment/affiliation
-            for entity in entities:
-                if entity.entity_type == 'organization':
-                    rel_type = self._detect_affiliation_type(content, entity.name)
-                    if rel_type:
-                        relationships.append(Relationship(
-                            source=subject_name,
-                            target=entity.name,
-                            relationship_type=rel_type,
-                            evidence=[f"Mentioned in {section.get('heading')}"],
-                            confidence=0.8
-                        ))
+            for entity in organizations:
+                rel_type = self._detect_affiliation_type(content, derived, entity.name)
+                if rel_type:
+                    relationships.append(Relationship(
+                        source=subject_name,
+                        target=entity.name,
+                        relationship_type=rel_type,
+                        evidence=[f"Mentioned in {section.get('heading')}"],
+                        confidence=0.8
+                    ))
 
         return relationships
 
-    def _indicates_collaboration(self, text: str, person_name: str) -> bool:
+    def _indicates_collaboration(
+        self,
+        text: str,
+        derived: Dict[str, Any],
+        person_name: str
+    ) -> bool:
         """Check if text indicates collaboration with a person."""
         if person_name not in text:
             return False
 
-        text_lower = text.lower()
-        return any(ind in text_lower for ind in self.COLLABORATION_INDICATORS)
+        return 'collaboration' in self._indicator_categories(derived)
 
-    def _detect_affiliation_type(self, text: str, org_name: str) -> Optional[str]:
+    def _detect_affiliation_type(
+        self,
+        text: str,
+        derived: Dict[str, Any],
+        org_name: str
+    ) -> Optional[str]:
         """Detect type of affiliation with an organization."""
         if org_name not in text:
             return None
 
-        text_lower = text.lower()
+        categories = self._indicator_categories(derived)
 
-        if any(ind in text_lower for ind in self.EMPLOYMENT_INDICATORS):
+        if 'employment' in categories:
             return 'employment'
-        if any(ind in text_lower for ind in self.EDUCATION_INDICATORS):
+        if 'education' in categories:
             return 'education'
 
         return 'affiliation'
 
+    def _indicator_categories(self, derived: Dict[str, Any]) -> Set[str]:
+        """Find (once per section) which relationship indicator categories occur in its text."""
+        categories = derived.get('categories')
+        if categories is None:
+            text_lower = derived['lower']
+            categories = derived['categories'] = {
+                category for category, indicators in self.INDICATOR_CATEGORIES
+                if any(ind in text_lower for ind in indicators)
+            }
+        return categories
+
     def build_timeline(self, research_data: Dict) -> List[TimelineEvent]:
         """
         Build a timeline of events from research data.
@@ -277,77 +392,74 @@ class EntityExtractor:
         Returns:
             Chronologically sorted list of timeline events
         """
-        events = []
-
-        # Date patterns
-        year_pattern = r'\b(19|20)\d{2}\b'
-        month_year_pattern = r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(19|20)\d{2}'
-        full_date_pattern = r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+(19|20)\d{2}'
-
-        # Event type keywords
-        event_keywords = {
-            'education': ['degree', 'graduated', 'phd', 'thesis', 'university', 'studied'],
-            'position': ['appointed', 'joined', 'became', 'professor', 'director'],
-            'award': ['awarded', 'received', 'prize', 'fellow', 'honored'],
-            'publication': ['published', 'paper', 'article', 'journal'],
-            'founding': ['founded', 'established', 'created', 'started']
-        }
+        # Events keyed for dedup (same year + similar description), first kept
+        unique_events = {}
 
-        for section in research_data.get('sections', []):
+        for section in self._prepare_sections(research_data):
             content = section.get('content', '')
             claims = section.get('claims', [])
 
+            # Lowercase all claim texts once into a single searchable string;
+            # words never contain the newline separator, so any hit lies
+            # within one claim, found by bisecting the claim start offsets
+            claim_texts = [claim.get('text', '').lower() for claim in claims]
+            claim_starts = []
+            offset = 0
+            for text in claim_texts:
+                claim_starts.append(offset)
+                offset += len(text) + 1
+            claims_joined = '\n'.join(claim_texts)
+
             # Split into sentences for better event extraction
-            sentences = re.split(r'[.!?]+', content)
+            sentences = self._section_text(content)['sentences']
 
             for sentence in sentences:
                 # Find dates in sentence
-                years = re.findall(year_pattern, sentence)
+                years = self._YEAR_RE.findall(sentence)
 
                 if years:
-                    # Determine event type
-                    event_type = 'general'
-                    sentence_lower = sentence.lower()
+                    # String transforms once per sentence
+                    description = sentence.strip()
+                    sentence_lower = description.lower()
+                    first_words = sentence_lower.split()[:5]
 
-                    for etype, keywords in event_keywords.items():
-                        if any(kw in sentence_lower for kw in keywords):
-                            event_type = etype
-                            break
+                    # Determine event type
+                    event_type = self._classify_event(sentence_lower)
 
-                    # Find matching claim for citations
+                    # Find the first claim containing any of the sentence's
+                    # first words, via the earliest hit in the joined texts
                     matching_citations = []
-                    for claim in claims:
-                        if any(word in claim.get('text', '').lower()
-                               for word in sentence.lower().split()[:5]):
-                            matching_citations = claim.get('citation_ids', [])
-                            break
-
-                    # Create event for each year mentioned (usually just one)
-                    for year in set(years):
-                        full_year = year if len(year) == 4 else f"20{year}" if int(year) < 50 else f"19{year}"
-
-                        events.append(TimelineEvent(
-                            date=full_year,
-                            date_precision='year',
-                            event_type=event_type,
-                            description=sentence.strip(),
-                            citation_ids=matching_citations,
-                            confidence=0.7 if matching_citations else 0.5
-                        ))
-
-        # Sort by date
-        events.sort(key=lambda e: e.date)
-
-        # Remove duplicates (same year + similar description)
-        unique_events = []
-        seen = set()
-        for event in events:
-            key = (event.date, event.event_type, event.description[:50])
-            if key not in seen:
-                seen.add(key)
-                unique_events.append(event)
-
-        return unique_events
+                    positions = (claims_joined.find(w) for w in first_words)
+                    hits = [pos for pos in positions if pos >= 0]
+                    if hits:
+                        claim = claims[bisect_right(claim_starts, min(hits)) - 1]
+                        matching_citations = claim.get('citation_ids', [])
+
+                    # Create event for each year mentioned (usually just one, so
+                    # only dedup when there are several)
+                    if len(years) > 1:
+                        years = dict.fromkeys(years)
+                    for year in years:
+                        key = (year, event_type, description[:50])
+                        if key not in unique_events:
+                            unique_events[key] = TimelineEvent(
+                                date=year,
+                                date_precision='year',
+                                event_type=event_type,
+                                description=description,
+                                citation_ids=matching_citations,
+                                confidence=0.7 if matching_citations else 0.5
+                            )
+
+        # Sort by date (stable, so ties keep extraction order)
+        return sorted(unique_events.values(), key=attrgetter('date'))
+
+    def _classify_event(self, sentence_lower: str) -> str:
+        """Pick the highest-priority event type with a keyword in the sentence."""
+        for event_type, keywords in self.EVENT_KEYWORDS.items():
+            if any(kw in sentence_lower for kw in keywords):
+                return event_type
+        return 'general'
 
     def generate_knowledge_graph(
         self,
@@ -381,7 +493,7 @@ class EntityExtractor:
                 'type': entity.entity_type,
                 'label': entity.name,
                 'wikipedia_url': entity.wikipedia_url,
-                'mention_count': len(entity.mentions)
+                'mention_count': len(entity.mention_sections)
             })
 
         # Build edges
@@ -428,10 +540,7 @@ class EntityExtractor:
 
     def _count_entity_types(self, entities: List[Entity]) -> Dict[str, int]:
         """Count entities by type."""
-        counts = defaultdict(int)
-        for entity in entities:
-            counts[entity.entity_type] += 1
-        return counts
+        return Counter(entity.entity_type for entity in entities)
 
 
 if __name__ == "__main__":
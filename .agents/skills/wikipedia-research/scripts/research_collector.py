@@ -5,11 +5,23 @@ Orchestrates multi-article research collection with citation aggregation.
 Outputs structured research data optimized for AI verification.
 """
 
+import heapq
 import json
+import threading
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Any
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Any
 from pathlib import Path
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from operator import itemgetter
+from urllib.parse import urlsplit, urlunsplit
+
+# Optional fast JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import local modules
 try:
@@ -20,6 +32,46 @@ except ImportError:
     from citation_extractor import CitationExtractor
 
 
+def _json_line(obj: Any) -> bytes:
+    """Encode obj as one UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def _citation_key(citation: Dict) -> Optional[str]:
+    """Key for the source a CSL-JSON citation cites: its DOI, else its canonical URL."""
+    doi = citation.get('DOI')
+    if doi:
+        # DOIs are case-insensitive
+        return f"doi:{doi.strip().lower()}"
+
+    url = (citation.get('URL') or '').strip()
+    if not url:
+        return None
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return f"url:{url}"
+    return "url:" + urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', parts.query, '')
+    )
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Decode UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class ResearchCollector:
     """Collect and organize research across multiple Wikipedia articles."""
 
@@ -33,18 +85,77 @@ class ResearchCollector:
         'F': 0.0    # Cannot be judged
     }
 
+    # Score thresholds shared by source ratings and verification statuses;
+    # a score maps to the entry at bisect_right(SCORE_THRESHOLDS, score)
+    SCORE_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+    SOURCE_RATINGS = ('E', 'D', 'C', 'B', 'A')
+    VERIFICATION_STATUSES = (
+        'insufficient_evidence',
+        'weakly_supported',
+        'partially_supported',
+        'supported',
+        'strongly_supported'
+    )
+
+    # Most articles fetched at once; the client's rate limit still spaces
+    # out request starts and it backs off when the API signals overload
+    MAX_FETCH_WORKERS = 8
+
+    # Most extracted articles kept for reuse this session, least recently
+    # used dropped first; each can hold thousands of citations
+    MAX_MEMO_ARTICLES = 64
+
     def __init__(self, language: str = "en", cache_dir: Optional[str] = None):
         """
         Initialize research collector.
 
         Args:
             language: Wikipedia language code
-            cache_dir: Directory for caching API responses
+            cache_dir: Directory for caching API responses and extracted
+                articles (reused while an article's revision is unchanged),
+                and for persisting the citation index
         """
         self.client = WikipediaClient(language=language, cache_dir=cache_dir)
-        self.extractor = CitationExtractor(language=language)
+        self.extractor = CitationExtractor(
+            language=language, cache_dir=cache_dir, session=self.client.session
+        )
         self.language = language
 
+        # Latest extraction per title this session as (revision ID, encoded
+        # JSON), reused while its revision is still current; each hit
+        # decodes a fresh copy, so callers cannot alter the memoized data
+        self._article_memo: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+        # Worker processes for article parsing, started on first use and
+        # kept for the collector's lifetime
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+        # Titles of every researched article citing each source (keyed by
+        # _citation_key), across all research calls and, with a cache_dir,
+        # across runs; saved when the collector is closed
+        self._citation_index_file = (
+            Path(cache_dir) / "citation_index.json" if cache_dir else None
+        )
+        self._citation_index: Dict[str, Set[str]] = self._load_citation_index()
+        self._citation_index_changed = False
+
+    def close(self):
+        """Save the citation index, close pooled HTTP connections and stop parser worker processes."""
+        if self._citation_index_changed:
+            self._save_citation_index()
+            self._citation_index_changed = False
+        self.client.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def research_topic(
         self,
         query: str,
@@ -65,57 +176,75 @@ class ResearchCollector:
             Comprehensive research data with aggregated citations
         """
         # Search for relevant articles
-        search_results = self.client.search(query, limit=max_articles * 2)
+        titles = self._search_titles(query, max_articles)
+        processed_titles = set(titles)
 
         # Process top articles
-        articles_data = []
-        all_citations = {}
-        citation_usage = defaultdict(list)  # Track which articles use each citation
-
-        processed_titles = set()
-
-        for result in search_results[:max_articles]:
-            title = result['title'].replace(' ', '_')
-
-            if title in processed_titles:
-                continue
-            processed_titles.add(title)
-
-            try:
-                if depth == "comprehensive":
-                    article_data = self.extractor.extract_article(title)
-                else:
-                    article_data = self._extract_summary(title)
-
-                articles_data.append(article_data)
-
-                # Aggregate citations
-                for citation in article_data.get('citations', []):
-                    cit_id = citation['id']
-                    if cit_id not in all_citations:
-                        all_citations[cit_id] = citation
-                    citation_usage[cit_id].append(article_data['article']['title'])
-
-            except Exception as e:
-                print(f"Error processing {title}: {e}")
-                continue
+        articles_data = self._extract_many(titles, depth)
 
         # Follow internal links if requested
         if follow_links and len(articles_data) < max_articles:
             additional = self._follow_links(
-                articles_data,
+                [article['article']['title'] for article in articles_data],
                 processed_titles,
                 max_articles - len(articles_data)
             )
             articles_data.extend(additional)
 
         # Build research output
-        return self._build_research_output(
+        return self._build_research_output(query=query, articles=articles_data)
+
+    def research_topic_stream(
+        self,
+        query: str,
+        filepath: str,
+        max_articles: int = 5,
+        depth: str = "comprehensive",
+        follow_links: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Research a topic, writing each article to a JSONL file as it is extracted.
+
+        Only citations and aggregate counts are held in memory. Everything
+        research_topic returns apart from 'articles' is written last to a
+        sidecar file alongside filepath with a '.meta.json' suffix.
+
+        Args:
+            query: Search query or topic
+            filepath: Output JSONL path, one article per line (in completion order)
+            max_articles: Maximum articles to process
+            depth: "summary" for quick overview, "comprehensive" for full extraction
+            follow_links: Whether to follow internal links for related articles
+
+        Returns:
+            The research metadata written to the sidecar file
+        """
+        path = Path(filepath)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        titles = self._search_titles(query, max_articles)
+
+        all_citations = {}
+        citation_usage = defaultdict(set)
+        articles_analyzed = 0
+        total_claims = 0
+
+        with open(path, 'wb', buffering=1 << 20) as f:
+            for article_data in self._iter_topic_articles(titles, max_articles, depth, follow_links):
+                f.write(_json_line(article_data))
+                articles_analyzed += 1
+                total_claims += self._aggregate_articles([article_data], all_citations, citation_usage)
+
+        research = self._research_metadata(
             query=query,
-            articles=articles_data,
+            articles_analyzed=articles_analyzed,
+            total_claims=total_claims,
             citations=all_citations,
             citation_usage=citation_usage
         )
+        self.save_research(research, str(path.with_suffix('.meta.json')))
+
+        return research
 
     def research_articles(
         self,
@@ -132,42 +261,20 @@ class ResearchCollector:
         Returns:
             Research data for specified articles
         """
-        articles_data = []
-        all_citations = {}
-        citation_usage = defaultdict(list)
-
-        for title in titles:
-            title = title.replace(' ', '_')
-
-            try:
-                if depth == "comprehensive":
-                    article_data = self.extractor.extract_article(title)
-                else:
-                    article_data = self._extract_summary(title)
-
-                articles_data.append(article_data)
-
-                for citation in article_data.get('citations', []):
-                    cit_id = citation['id']
-                    if cit_id not in all_citations:
-                        all_citations[cit_id] = citation
-                    citation_usage[cit_id].append(article_data['article']['title'])
-
-            except Exception as e:
-                print(f"Error processing {title}: {e}")
-                continue
+        articles_data = self._extract_many(
+            [self._norm(title) for title in titles], depth
+        )
 
         return self._build_research_output(
             query=f"Articles: {', '.join(titles)}",
-            articles=articles_data,
-            citations=all_citations,
-            citation_usage=citation_usage
+            articles=articles_data
         )
 
     def find_related_by_citations(
         self,
         title: str,
-        min_shared_citations: int = 2
+        min_shared_citations: int = 2,
+        top_k: Optional[int] = None
     ) -> List[Dict]:
         """
         Find articles that share citations with the given article.
@@ -175,46 +282,50 @@ class ResearchCollector:
         Args:
             title: Source article title
             min_shared_citations: Minimum shared citations to be considered related
+            top_k: Return only the top_k most related articles (None for all)
 
         Returns:
-            List of related articles with shared citation info
+            List of related articles with shared citation info, most shared first
         """
         # Get source article citations
-        source_data = self.extractor.extract_article(title)
-        source_citations = {
-            c.get('URL') or c.get('DOI') or c.get('title'): c
-            for c in source_data.get('citations', [])
-            if c.get('URL') or c.get('DOI') or c.get('title')
-        }
+        source_data = self._memo_extract(title)
+        source_keys = frozenset(
+            key for c in source_data.get('citations', [])
+            if (key := c.get('URL') or c.get('DOI') or c.get('title'))
+        )
 
         # Get linked articles
         linked_titles = self.client.get_links(title)[:50]
 
         related_articles = []
 
-        for linked_title in linked_titles:
-            try:
-                linked_data = self.extractor.extract_citations(linked_title)
-
-                # Find shared citations
-                shared = []
-                for citation in linked_data:
-                    key = citation.get('URL') or citation.get('DOI') or citation.get('title')
-                    if key and key in source_citations:
-                        shared.append(citation)
-
-                if len(shared) >= min_shared_citations:
-                    related_articles.append({
-                        'title': linked_title,
-                        'shared_citations': len(shared),
-                        'shared_citation_ids': [c['id'] for c in shared]
-                    })
-
-            except Exception:
-                continue
+        try:
+            linked_citations = self.extractor.extract_citations_bulk(linked_titles)
+        except Exception as e:
+            print(f"Error processing links of {title}: {e}")
+            linked_citations = {}
+
+        for linked_title, linked_data in linked_citations.items():
+            # Find shared citations
+            shared = []
+            for citation in linked_data:
+                key = citation.get('URL') or citation.get('DOI') or citation.get('title')
+                if key in source_keys:
+                    shared.append(citation)
+
+            if len(shared) >= min_shared_citations:
+                related_articles.append({
+                    'title': linked_title,
+                    'shared_citations': len(shared),
+                    'shared_citation_ids': [c['id'] for c in shared]
+                })
 
         # Sort by number of shared citations
-        related_articles.sort(key=lambda x: x['shared_citations'], reverse=True)
+        by_shared = itemgetter('shared_citations')
+        if top_k is not None:
+            return heapq.nlargest(top_k, related_articles, key=by_shared)
+
+        related_articles.sort(key=by_shared, reverse=True)
 
         return related_articles
 
@@ -233,47 +344,95 @@ class ResearchCollector:
         Returns:
             Verification results with supporting/contradicting evidence
         """
+        return self.verify_claims([claim], articles)[0]
+
+    def verify_claims(
+        self,
+        claims: List[str],
+        articles: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Verify several claims against the same articles, extracting each once.
+
+        Articles are fetched concurrently, and each article's citations are
+        indexed and claims tokenized once for the whole batch.
+
+        Args:
+            claims: The claims to verify
+            articles: Articles to search for supporting evidence
+
+        Returns:
+            Verification results for each claim, in order (as verify_claim)
+        """
+        # One batched revision check covers every memoized article; only
+        # the rest are extracted
+        extracted = self._current_memo(articles)
+        extracted.update(self._map_titles(
+            self._extract_and_remember,
+            [title for title in articles if title not in extracted],
+            error_action="checking"
+        ))
+
+        prepared = {
+            title: (
+                {c['id']: c for c in article_data.get('citations', [])},
+                self._claim_word_sets(article_data)
+            )
+            for title, article_data in extracted.items()
+        }
+        checked = [(title, *prepared[title]) for title in articles if title in prepared]
+
+        verified_at = datetime.now().isoformat()
+
+        return [
+            self._verify_against(claim, articles, checked, verified_at)
+            for claim in claims
+        ]
+
+    def _verify_against(
+        self,
+        claim: str,
+        articles: List[str],
+        checked: List[Tuple[str, Dict[str, Dict], List[Tuple[Dict, Dict, FrozenSet[str]]]]],
+        verified_at: str
+    ) -> Dict[str, Any]:
+        """Score one claim against (title, citations by id, claim word sets) per article."""
         supporting_evidence = []
         related_content = []
 
         claim_words = set(claim.lower().split())
-
-        for title in articles:
-            try:
-                article_data = self.extractor.extract_article(title)
-
-                for section in article_data.get('sections', []):
-                    for article_claim in section.get('claims', []):
-                        claim_text = article_claim.get('text', '').lower()
-                        claim_text_words = set(claim_text.split())
-
-                        # Simple overlap check (could be enhanced with NLP)
-                        overlap = len(claim_words & claim_text_words) / len(claim_words)
-
-                        if overlap > 0.3:  # Threshold for relevance
-                            evidence = {
-                                'article': title,
-                                'section': section.get('heading'),
-                                'text': article_claim.get('text'),
-                                'citation_ids': article_claim.get('citation_ids', []),
-                                'confidence': article_claim.get('confidence', 0),
-                                'relevance': round(overlap, 2)
-                            }
-
-                            # Get full citation details
-                            evidence['citations'] = [
-                                c for c in article_data.get('citations', [])
-                                if c['id'] in article_claim.get('citation_ids', [])
-                            ]
-
-                            if overlap > 0.5:
-                                supporting_evidence.append(evidence)
-                            else:
-                                related_content.append(evidence)
-
-            except Exception as e:
-                print(f"Error checking {title}: {e}")
-                continue
+        n_claim_words = len(claim_words)
+
+        # An empty claim has no words to overlap with
+        if not n_claim_words:
+            checked = []
+
+        for title, cit_by_id, claim_word_sets in checked:
+            for section, article_claim, claim_text_words in claim_word_sets:
+                # Simple overlap check (could be enhanced with NLP)
+                overlap = len(claim_words & claim_text_words) / n_claim_words
+
+                if overlap > 0.3:  # Threshold for relevance
+                    evidence = {
+                        'article': title,
+                        'section': section.get('heading'),
+                        'text': article_claim.get('text'),
+                        'citation_ids': article_claim.get('citation_ids', []),
+                        'confidence': article_claim.get('confidence', 0),
+                        'relevance': round(overlap, 2)
+                    }
+
+                    # Get full citation details (each cited once)
+                    evidence['citations'] = [
+                        cit_by_id[cit_id]
+                        for cit_id in dict.fromkeys(evidence['citation_ids'])
+                        if cit_id in cit_by_id
+                    ]
+
+                    if overlap > 0.5:
+                        supporting_evidence.append(evidence)
+                    else:
+                        related_content.append(evidence)
 
         # Calculate overall verification score
         verification_score = 0.0
@@ -289,9 +448,29 @@ class ResearchCollector:
             'supporting_evidence': supporting_evidence,
             'related_content': related_content,
             'articles_checked': articles,
-            'verified_at': datetime.now().isoformat()
+            'verified_at': verified_at
         }
 
+    def articles_sharing_citation(self, citation: Dict) -> Set[str]:
+        """
+        Find every researched article that cites the same source as a citation.
+
+        Sources are matched by DOI, else by URL, since citation IDs are only
+        unique within one article. Answers from the citation index built up
+        by all research calls, not just the latest one.
+
+        Args:
+            citation: CSL-JSON citation, e.g. from a research result's 'citations'
+
+        Returns:
+            Titles of the articles citing the source (empty if the citation
+            has neither a DOI nor a URL)
+        """
+        key = _citation_key(citation)
+        if key is None:
+            return set()
+        return set(self._citation_index.get(key, ()))
+
     def save_research(
         self,
         research: Dict,
@@ -301,6 +480,9 @@ class ResearchCollector:
         """
         Save research data to file.
 
+        Encodes with orjson straight to bytes when it is installed, otherwise
+        with the standard json module.
+
         Args:
             research: Research data to save
             filepath: Output file path
@@ -310,13 +492,18 @@ class ResearchCollector:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         if format == "json":
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(research, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                path.write_bytes(orjson.dumps(
+                    research, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+            else:
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(research, f, indent=2, ensure_ascii=False)
         elif format == "jsonl":
-            with open(path, 'w', encoding='utf-8') as f:
+            with open(path, 'wb', buffering=1 << 20) as f:
                 # Write articles as separate lines
                 for article in research.get('articles', []):
-                    f.write(json.dumps(article, ensure_ascii=False) + '\n')
+                    f.write(_json_line(article))
         else:
             raise ValueError(f"Unsupported format: {format}")
 
@@ -327,9 +514,262 @@ class ResearchCollector:
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
 
+    @staticmethod
+    def _norm(title: str) -> str:
+        """Normalize a title to the underscored form used for requests and dedup."""
+        return title.replace(' ', '_')
+
+    def _search_titles(self, query: str, max_articles: int) -> List[str]:
+        """Search for a topic and return the distinct top result titles."""
+        search_results = self.client.search(query, limit=max_articles * 2)
+
+        return list(dict.fromkeys(
+            self._norm(result['title']) for result in search_results[:max_articles]
+        ))
+
+    def _iter_topic_articles(
+        self,
+        titles: List[str],
+        max_articles: int,
+        depth: str,
+        follow_links: bool
+    ) -> Iterator[Dict]:
+        """Extract articles concurrently, yielding each (then any followed links) as it completes."""
+        extract = self._memo_extract if depth == "comprehensive" else self._extract_summary
+        processed_titles = set(titles)
+        extracted_titles = []
+
+        for _, article_data in self._iter_titles(extract, titles):
+            extracted_titles.append(article_data['article']['title'])
+            yield article_data
+
+        if follow_links and len(extracted_titles) < max_articles:
+            yield from self._follow_links(
+                extracted_titles,
+                processed_titles,
+                max_articles - len(extracted_titles)
+            )
+
+    def _claim_word_sets(self, article_data: Dict) -> List[Tuple[Dict, Dict, FrozenSet[str]]]:
+        """Tokenize each of an article's claims once, as (section, claim, words)."""
+        return [
+            (section, article_claim, frozenset(article_claim.get('text', '').lower().split()))
+            for section in article_data.get('sections', [])
+            for article_claim in section.get('claims', [])
+        ]
+
+    def _extract_many(self, titles: List[str], depth: str) -> List[Dict]:
+        """
+        Extract several articles concurrently.
+
+        Args:
+            titles: Article titles (use underscores for spaces)
+            depth: "summary" or "comprehensive"
+
+        Returns:
+            Extracted data for each title that succeeded, in input order
+        """
+        if depth == "comprehensive":
+            extracted = self._memo_extract_many(titles)
+        else:
+            extracted = self._map_titles(self._extract_summary, titles)
+
+        return list(extracted.values())
+
+    def _memo_extract(self, title: str) -> Dict:
+        """Extract an article, reusing this session's extraction of its current revision."""
+        cached = self._current_memo([title]).get(title)
+        if cached is not None:
+            return cached
+
+        return self._extract_and_remember(title)
+
+    def _extract_and_remember(self, title: str) -> Dict:
+        """Extract an article and memoize the extraction for this session."""
+        article_data = self.extractor.extract_article(title)
+        self._remember(title, article_data)
+        return article_data
+
+    def _memo_extract_many(self, titles: List[str]) -> Dict[str, Dict]:
+        """
+        Extract several articles, reusing this session's extractions where unchanged.
+
+        Args:
+            titles: Article titles (use underscores for spaces)
+
+        Returns:
+            Dictionary mapping each title that succeeded (in input order) to
+            the same structure CitationExtractor.extract_article returns
+        """
+        titles = list(dict.fromkeys(titles))
+        results = self._current_memo(titles)
+
+        missing = [t for t in titles if t not in results]
+        if missing:
+            extracted = self.extractor.extract_articles(
+                missing,
+                max_workers=self._fetch_workers(missing),
+                parse_pool=self._get_parse_pool()
+            )
+            for title, article_data in extracted.items():
+                self._remember(title, article_data)
+            results.update(extracted)
+
+        return {t: results[t] for t in titles if t in results}
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Get the collector's parser process pool, starting it if needed."""
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor()
+        return self._parse_pool
+
+    def _current_memo(self, titles: List[str]) -> Dict[str, Dict]:
+        """
+        Look up this session's extractions of titles whose revision is unchanged.
+
+        Only titles already extracted cost a revision check, batched into as
+        few requests as possible; a failed check counts as changed.
+        """
+        with self._memo_lock:
+            seen = {t: self._article_memo[t] for t in titles if t in self._article_memo}
+        if not seen:
+            return {}
+
+        try:
+            revids = self.extractor.client.get_revision_ids(list(seen))
+        except Exception:
+            return {}
+
+        current = {
+            title: raw for title, (revision_id, raw) in seen.items()
+            if revision_id == str(revids.get(title))
+        }
+        with self._memo_lock:
+            for title in current:
+                if title in self._article_memo:
+                    self._article_memo.move_to_end(title)
+        return {title: _json_loads(raw) for title, raw in current.items()}
+
+    def _remember(self, title: str, article_data: Dict):
+        """Memoize an encoded snapshot of an article's extraction, evicting the least recently used."""
+        snapshot = (article_data['article']['revision_id'], _json_bytes(article_data))
+        with self._memo_lock:
+            self._article_memo[title] = snapshot
+            self._article_memo.move_to_end(title)
+            while len(self._article_memo) > self.MAX_MEMO_ARTICLES:
+                self._article_memo.popitem(last=False)
+
+    def _map_titles(
+        self,
+        func: Callable[[str], Any],
+        titles: List[str],
+        error_action: Optional[str] = "processing"
+    ) -> Dict[str, Any]:
+        """
+        Call func for each title on a thread pool.
+
+        Args:
+            func: Per-title fetch, e.g. self._extract_summary
+            titles: Titles to process (duplicates are processed once)
+            error_action: Verb used when printing failures (None to skip them
+                silently)
+
+        Returns:
+            Dictionary mapping each title that succeeded (in input order) to
+            its result
+        """
+        results = dict(self._iter_titles(func, titles, error_action))
+
+        return {t: results[t] for t in titles if t in results}
+
+    def _iter_titles(
+        self,
+        func: Callable[[str], Any],
+        titles: List[str],
+        error_action: Optional[str] = "processing"
+    ) -> Iterator[Tuple[str, Any]]:
+        """Call func for each title on a thread pool, yielding (title, result) as each succeeds."""
+        titles = list(dict.fromkeys(titles))
+
+        with ThreadPoolExecutor(max_workers=self._fetch_workers(titles)) as pool:
+            futures = {pool.submit(func, t): t for t in titles}
+            for future in as_completed(futures):
+                title = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if error_action:
+                        print(f"Error {error_action} {title}: {e}")
+                    continue
+                yield title, result
+
+    def _fetch_workers(self, titles: List[str]) -> int:
+        """Size a fetch pool to the work, capped at MAX_FETCH_WORKERS."""
+        return max(1, min(self.MAX_FETCH_WORKERS, len(titles)))
+
+    def _aggregate_articles(
+        self,
+        articles: List[Dict],
+        all_citations: Dict[str, Dict],
+        citation_usage: Dict[str, Set[str]]
+    ) -> int:
+        """
+        Record articles' citations and which articles use them in one pass.
+
+        Args:
+            articles: Extracted article data
+            all_citations: Citations by ID, updated in place
+            citation_usage: Titles of the articles using each citation ID,
+                updated in place (as is the collector's citation index, by
+                cited source)
+
+        Returns:
+            Number of claims extracted across the articles
+        """
+        total_claims = 0
+
+        for article_data in articles:
+            for section in article_data.get('sections', ()):
+                total_claims += len(section.get('claims', ()))
+
+            title = article_data['article']['title']
+            for citation in article_data.get('citations', ()):
+                cit_id = citation['id']
+                if cit_id not in all_citations:
+                    all_citations[cit_id] = citation
+                citation_usage[cit_id].add(title)
+
+                key = _citation_key(citation)
+                if key is not None:
+                    self._citation_index.setdefault(key, set()).add(title)
+                    self._citation_index_changed = True
+
+        return total_claims
+
+    def _load_citation_index(self) -> Dict[str, Set[str]]:
+        """Load the persisted citation index, or start an empty one."""
+        if not self._citation_index_file or not self._citation_index_file.exists():
+            return {}
+
+        try:
+            with open(self._citation_index_file, 'r', encoding='utf-8') as f:
+                return {cit_id: set(titles) for cit_id, titles in json.load(f).items()}
+        except (OSError, ValueError, AttributeError, TypeError):
+            # Unreadable or malformed (ValueError covers bad JSON and UTF-8)
+            return {}
+
+    def _save_citation_index(self):
+        """Persist the citation index when the collector has a cache_dir."""
+        if not self._citation_index_file:
+            return
+
+        index = {cit_id: sorted(titles) for cit_id, titles in self._citation_index.items()}
+        with open(self._citation_index_file, 'wb') as f:
+            f.write(_json_line(index))
+
     def _extract_summary(self, title: str) -> Dict:
         """Extract summary-level data for an article."""
-        article = self.client.get_article(title, include_wikitext=False)
+        article = self.client.get_summary(title)
 
         return {
             'article': {
@@ -352,118 +792,154 @@ class ResearchCollector:
 
     def _follow_links(
         self,
-        articles: List[Dict],
+        titles: List[str],
         processed: Set[str],
         max_additional: int
     ) -> List[Dict]:
-        """Follow internal links to find related articles."""
-        additional_articles = []
-
-        # Collect all links from processed articles
-        all_links = set()
-        for article in articles:
-            title = article['article']['title'].replace(' ', '_')
-            links = self.client.get_links(title)
-            all_links.update(links[:20])
-
-        # Remove already processed
-        new_links = [l for l in all_links if l.replace(' ', '_') not in processed]
-
-        # Process additional articles
-        for link in new_links[:max_additional]:
-            link_title = link.replace(' ', '_')
-            if link_title in processed:
-                continue
-
-            try:
-                article_data = self._extract_summary(link_title)
-                additional_articles.append(article_data)
+        """
+        Follow internal links from the given articles to find related articles.
+
+        Link lists and linked-article extraction share one pool, so each
+        article's new links start extracting as soon as its link list
+        arrives instead of after every list has been fetched.
+
+        This runs after primary extraction rather than overlapping it:
+        whether links are followed at all, how many, and from which
+        articles all depend on which primary articles extracted, and
+        fetching link lists ahead of that would mostly be wasted requests.
+
+        Args:
+            titles: Titles of the articles to follow links from
+            processed: Titles already researched; updated with each added article
+            max_additional: Maximum linked articles to extract
+
+        Returns:
+            Summary data for each linked article extracted
+        """
+        scheduled = {}
+
+        with ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS) as pool:
+            link_futures = [
+                pool.submit(self.client.get_links, self._norm(title))
+                for title in titles
+            ]
+
+            for future in as_completed(link_futures):
+                for link in future.result()[:20]:
+                    link_title = self._norm(link)
+                    if link_title not in processed and link_title not in scheduled:
+                        scheduled[link_title] = pool.submit(self._extract_summary, link_title)
+                        if len(scheduled) >= max_additional:
+                            break
+
+                if len(scheduled) >= max_additional:
+                    # Enough candidates; skip link lists not yet started
+                    for pending in link_futures:
+                        pending.cancel()
+                    break
+
+            additional_articles = []
+            for link_title, future in scheduled.items():
+                try:
+                    additional_articles.append(future.result())
+                except Exception:
+                    continue
                 processed.add(link_title)
-            except Exception:
-                continue
 
         return additional_articles
 
-    def _build_research_output(
+    def _build_research_output(self, query: str, articles: List[Dict]) -> Dict:
+        """Build the final research output structure."""
+        # Aggregate citations and statistics
+        all_citations = {}
+        citation_usage = defaultdict(set)  # Track which articles use each citation
+        total_claims = self._aggregate_articles(articles, all_citations, citation_usage)
+
+        return self._research_metadata(
+            query=query,
+            articles_analyzed=len(articles),
+            total_claims=total_claims,
+            citations=all_citations,
+            citation_usage=citation_usage,
+            articles=articles
+        )
+
+    def _research_metadata(
         self,
         query: str,
-        articles: List[Dict],
+        articles_analyzed: int,
+        total_claims: int,
         citations: Dict,
-        citation_usage: Dict
+        citation_usage: Dict,
+        articles: Optional[List[Dict]] = None
     ) -> Dict:
-        """Build the final research output structure."""
-        # Calculate aggregate statistics
-        total_claims = sum(
-            len(section.get('claims', []))
-            for article in articles
-            for section in article.get('sections', [])
-        )
+        """Build the research output structure, including 'articles' only if given."""
+        now = datetime.now().isoformat()
 
         # Identify high-value citations (used in multiple articles)
         cross_referenced = [
             {
                 'citation': citations[cid],
-                'used_in': titles,
+                'used_in': sorted(titles),
                 'usage_count': len(titles)
             }
             for cid, titles in citation_usage.items()
             if len(titles) > 1
         ]
-        cross_referenced.sort(key=lambda x: x['usage_count'], reverse=True)
 
         # Assess overall source quality
         quality_assessment = self._assess_source_quality(list(citations.values()))
 
-        return {
+        research = {
             'research_query': query,
-            'research_date': datetime.now().isoformat(),
+            'research_date': now,
             'summary': {
-                'articles_analyzed': len(articles),
+                'articles_analyzed': articles_analyzed,
                 'total_citations': len(citations),
                 'total_claims_extracted': total_claims,
                 'cross_referenced_citations': len(cross_referenced),
                 'source_quality': quality_assessment
-            },
-            'articles': articles,
+            }
+        }
+        if articles is not None:
+            research['articles'] = articles
+
+        research.update({
             'all_citations': list(citations.values()),
-            'cross_referenced_citations': cross_referenced[:20],
+            'cross_referenced_citations': heapq.nlargest(
+                20, cross_referenced, key=itemgetter('usage_count')
+            ),
             'provenance': {
                 'tool': 'Wikipedia Research Skill',
                 'version': '1.0',
                 'language': self.language,
                 'extraction_method': 'MediaWiki API + wikitext parsing',
-                'generated_at': datetime.now().isoformat()
+                'generated_at': now
             }
-        }
+        })
+
+        return research
 
     def _assess_source_quality(self, citations: List[Dict]) -> Dict:
         """Assess overall quality of sources."""
         if not citations:
             return {'rating': 'F', 'score': 0, 'breakdown': {}}
 
+        # Count the citations having each field, one field at a time
+        doi, pmid, url, author, issued = (
+            sum(1 for citation in citations if citation.get(field))
+            for field in ('DOI', 'PMID', 'URL', 'author', 'issued')
+        )
+
         quality_indicators = {
-            'has_doi': 0,
-            'has_url': 0,
-            'has_author': 0,
-            'has_date': 0,
-            'peer_reviewed': 0,  # Approximated by DOI/PMID
-            'accessible': 0  # Has URL
+            'has_doi': doi,
+            'has_url': url,
+            'has_author': author,
+            'has_date': issued,
+            'peer_reviewed': doi + pmid,  # Approximated by DOI/PMID
+            'accessible': url  # Has URL
         }
 
-        for citation in citations:
-            if citation.get('DOI'):
-                quality_indicators['has_doi'] += 1
-                quality_indicators['peer_reviewed'] += 1
-            if citation.get('PMID'):
-                quality_indicators['peer_reviewed'] += 1
-            if citation.get('URL'):
-                quality_indicators['has_url'] += 1
-                quality_indicators['accessible'] += 1
-            if citation.get('author'):
-                quality_indicators['has_author'] += 1
-            if citation.get('issued'):
-                quality_indicators['has_date'] += 1
-
         total = len(citations)
         percentages = {k: round(v / total * 100, 1) for k, v in quality_indicators.items()}
 
@@ -477,16 +953,7 @@ class ResearchCollector:
         ) / 100
 
         # Map to Admiralty rating
-        if score >= 0.8:
-            rating = 'A'
-        elif score >= 0.6:
-            rating = 'B'
-        elif score >= 0.4:
-            rating = 'C'
-        elif score >= 0.2:
-            rating = 'D'
-        else:
-            rating = 'E'
+        rating = self.SOURCE_RATINGS[bisect_right(self.SCORE_THRESHOLDS, score)]
 
         return {
             'rating': rating,
@@ -496,16 +963,7 @@ class ResearchCollector:
 
     def _get_verification_status(self, score: float) -> str:
         """Get verification status from score."""
-        if score >= 0.8:
-            return 'strongly_supported'
-        elif score >= 0.6:
-            return 'supported'
-        elif score >= 0.4:
-            return 'partially_supported'
-        elif score >= 0.2:
-            return 'weakly_supported'
-        else:
-            return 'insufficient_evidence'
+        return self.VERIFICATION_STATUSES[bisect_right(self.SCORE_THRESHOLDS, score)]
 
 
 if __name__ == "__main__":
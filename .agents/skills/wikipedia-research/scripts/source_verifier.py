@@ -7,12 +7,27 @@ Critical for AI-consumable research verification.
 
 import re
 import json
+import os
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
+from pathlib import Path
+from collections import defaultdict
 import hashlib
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
+# Optional fast JSON parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     from .wikipedia_client import WikipediaClient
@@ -20,7 +35,157 @@ except ImportError:
     from wikipedia_client import WikipediaClient
 
 
-@dataclass
+# Common uncertainty templates, grouped by the flag type they raise
+_UNCERTAINTY_TEMPLATES = (
+    ('citation_needed', (r'\{\{citation needed\}\}', r'\{\{cn\}\}', r'\{\{fact\}\}')),
+    ('disputed', (r'\{\{disputed\}\}', r'\{\{dubious\}\}')),
+    ('original_research', (r'\{\{or\}\}', r'\{\{original research\}\}')),
+    ('primary_source', (r'\{\{primary source[^}]*\}\}',)),
+    ('unreliable_source', (r'\{\{unreliable source\}\}',)),
+    ('outdated', (r'\{\{update\}\}', r'\{\{out of date\}\}')),
+    ('vague_time', (r'\{\{when\}\}',)),
+    ('vague_attribution', (r'\{\{who\}\}',)),
+    ('peacock_language', (r'\{\{peacock\}\}',)),
+    ('weasel_words', (r'\{\{weasel\}\}',)),
+)
+# Section headings (kept to one line, so an unclosed '==' cannot swallow
+# the templates after it) and every template in one alternation, with a
+# named group per flag type: the wikitext is scanned once, in order, and
+# match.lastgroup says whether a heading or which kind of flag was found
+_FLAG_SCAN_RE = re.compile(
+    r'(?P<heading>==+[ \t]*(?P<heading_text>[^=\n]+)==+)|'
+    + '|'.join(
+        f"(?P<{flag_type}>{'|'.join(patterns)})"
+        for flag_type, patterns in _UNCERTAINTY_TEMPLATES
+    ),
+    re.IGNORECASE
+)
+
+# Keywords to identify claim topics, matched against lowercased claim text
+_TOPIC_KEYWORDS = {
+    'education': ['degree', 'university', 'phd', 'bsc', 'graduated', 'thesis'],
+    'position': ['professor', 'director', 'member', 'faculty'],
+    'award': ['prize', 'award', 'fellow', 'honored'],
+    'date': ['19', '20', 'year', 'month']
+}
+_TOPIC_RES = {
+    topic: re.compile('|'.join(map(re.escape, keywords)))
+    for topic, keywords in _TOPIC_KEYWORDS.items()
+}
+# Every keyword in one alternation: claims matching no topic are rejected
+# with a single scan before the per-topic patterns run
+_ANY_TOPIC_RE = re.compile(
+    '|'.join(re.escape(kw) for keywords in _TOPIC_KEYWORDS.values() for kw in keywords)
+)
+# Non-capturing, so findall returns whole years rather than the century
+_DATE_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+
+_DOI_PREFIX_RE = re.compile(r'^https?://(?:dx\.)?doi\.org/', re.IGNORECASE)
+_PMID_PREFIX_RE = re.compile(r'^pmid:?\s*', re.IGNORECASE)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_SPACES_RE = re.compile(r'\s+')
+
+
+def _clean_doi(doi: str) -> str:
+    """Strip a doi.org (or dx.doi.org) resolver prefix from a DOI."""
+    return _DOI_PREFIX_RE.sub('', doi.strip(), count=1)
+
+
+def _clean_pmid(pmid: Any) -> str:
+    """Strip a 'PMID:' label from a PubMed ID."""
+    return _PMID_PREFIX_RE.sub('', str(pmid).strip(), count=1)
+
+
+def _canonical_url(url: str) -> str:
+    """Lowercase a URL's scheme and host, sort its query and drop the fragment.
+
+    Malformed URLs that urlsplit rejects (e.g. an unclosed IPv6 bracket) are
+    returned stripped but otherwise as-is, so the check itself can report them.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+
+def _check_key(check: str, value: Any) -> str:
+    """Canonical form of a checked URL, DOI or PMID, so variants share one check."""
+    if check == 'url':
+        return _canonical_url(value)
+    if check == 'doi':
+        # DOIs are case-insensitive
+        return _clean_doi(value).lower()
+    return _clean_pmid(value)
+
+
+def _normalize_title(title: str) -> str:
+    """Lowercase a title and drop punctuation and repeated whitespace."""
+    return _SPACES_RE.sub(' ', _PUNCT_RE.sub('', title.lower())).strip()
+
+
+# Title similarity from which a disagreement is graded minor, not moderate
+_MINOR_TITLE_SIMILARITY = 0.7
+
+
+def _title_similarity(a: str, b: str, threshold: float = 0.0) -> float:
+    """
+    Levenshtein similarity of two strings, 1 - distance / longer length.
+
+    Args:
+        a: First string
+        b: Second string
+        threshold: Similarity of interest; when the length difference alone
+            rules it out, the full comparison is skipped
+
+    Returns:
+        Similarity in [0, 1], or 0.0 if the length difference alone puts it
+        below threshold
+    """
+    if a == b:
+        return 1.0
+    longest = max(len(a), len(b))
+    bound = 1 - abs(len(a) - len(b)) / longest
+    if bound < threshold:
+        return 0.0
+
+    # Shared prefix and suffix never change the distance
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if len(a) < len(b):
+        a, b = b, a
+
+    # Two-row dynamic programme over the shorter string
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+
+    return 1 - previous[-1] / longest
+
+
+def _json_body(response: requests.Response) -> Any:
+    """Parse a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@dataclass(slots=True)
 class VerificationResult:
     """Result of verifying a single citation."""
     citation_id: str
@@ -33,7 +198,7 @@ class VerificationResult:
     notes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsistencyIssue:
     """A detected inconsistency between sources."""
     claim: str
@@ -43,7 +208,7 @@ class ConsistencyIssue:
     resolution: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UncertaintyFlag:
     """Flag for uncertain or disputed content."""
     section: str
@@ -68,43 +233,218 @@ class SourceVerifier:
     # PubMed API
     PUBMED_API = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
 
-    def __init__(self, timeout: int = 10):
+    # Upper bound on network checks run concurrently
+    MAX_VERIFY_WORKERS = 10
+
+    # Normalized title similarity below which an external record disagrees
+    TITLE_MATCH_THRESHOLD = 0.9
+
+    # Title comparisons (about 1 ms each) below which external sources are
+    # compared in-process; dispatching to worker processes costs 10-100 ms
+    PARALLEL_COMPARE_MIN = 200
+
+    # Hosts whose keep-alive pools are retained; citation URLs span many
+    # hosts, and the DOI, PubMed and Wayback pools should not be evicted
+    POOL_HOSTS = 32
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        cache_dir: Optional[str] = None,
+        cache_ttl: int = 86400
+    ):
+        """
+        Initialize source verifier.
+
+        Args:
+            timeout: Per-request timeout in seconds
+            cache_dir: Directory for caching definitive check results
+                across runs (None to disable)
+            cache_ttl: Cache time-to-live in seconds
+        """
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'WikipediaResearchSkill/1.0 (research verification)'
         })
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_HOSTS,
+            pool_maxsize=self.MAX_VERIFY_WORKERS
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Checks already started, keyed by check type and canonical URL, DOI
+        # or PMID, so a source cited repeatedly is checked once per verifier
+        self._checks: Dict[str, Future] = {}
+
+        self._cache_db = None
+        self._cache_lock = threading.Lock()
+        if cache_dir:
+            cache_path = Path(cache_dir)
+            cache_path.mkdir(parents=True, exist_ok=True)
+            self._cache_db = self._open_cache_db(cache_path / "verification.sqlite")
+
+        # Started on first use by a large comparison against external sources
+        self._compare_pool: Optional[ProcessPoolExecutor] = None
+        self._compare_pool_workers: Optional[int] = None
+
+    def _open_cache_db(self, path: Path) -> sqlite3.Connection:
+        """Open the check result database, dropping entries past their TTL."""
+        # Autocommit, shared across check threads under _cache_lock
+        db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS checks (k TEXT PRIMARY KEY, ts REAL, result BLOB)"
+        )
+        db.execute("DELETE FROM checks WHERE ts < ?", (time.time() - self.cache_ttl,))
+        return db
+
+    def close(self):
+        """Close the check result database, pooled HTTP connections and comparison workers."""
+        if self._cache_db is not None:
+            with self._cache_lock:
+                self._cache_db.close()
+                self._cache_db = None
+        self.session.close()
+        if self._compare_pool is not None:
+            self._compare_pool.shutdown()
+            self._compare_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def verify_citations(self, citations: List[Dict]) -> Dict[str, VerificationResult]:
         """
         Verify all citations in a research output.
 
+        The URL, DOI and PMID checks of every citation are independent, so
+        they all run concurrently (up to MAX_VERIFY_WORKERS at a time) and a
+        citation costs its slowest check rather than the sum of them.
+
         Args:
             citations: List of CSL-JSON citations
 
         Returns:
             Dictionary mapping citation IDs to verification results
         """
-        results = {}
+        if not citations:
+            return {}
+
+        # One timestamp for the whole pass
+        checked_at = datetime.now().isoformat()
+
+        with ThreadPoolExecutor(max_workers=self.MAX_VERIFY_WORKERS) as pool:
+            pending = [
+                (citation, self._submit_checks(pool, citation))
+                for citation in citations
+            ]
+            verified = (
+                self._verify_single_citation(citation, checks, checked_at)
+                for citation, checks in pending
+            )
+            return {result.citation_id: result for result in verified}
+
+    def _submit_checks(self, pool: ThreadPoolExecutor, citation: Dict) -> Dict[str, Future]:
+        """Start a citation's URL, DOI and PMID checks on pool."""
+        checks = {}
+        for check, csl_field, func in (
+            ('url', 'URL', self._check_url_or_archive),
+            ('doi', 'DOI', self._verify_doi),
+            ('pmid', 'PMID', self._verify_pmid)
+        ):
+            value = citation.get(csl_field)
+            if not value:
+                continue
+
+            key = f"{check}:{_check_key(check, value)}"
+            future = self._checks.get(key)
+            # Reuse the earlier check unless it raised or was inconclusive
+            if future is None or (future.done() and (
+                future.exception() is not None or not future.result()[1]
+            )):
+                future = self._checks[key] = pool.submit(self._run_check, key, value, func)
+            checks[check] = future
+        return checks
+
+    def _run_check(
+        self,
+        cache_key: str,
+        value: Any,
+        func: Callable[[Any], Tuple[Any, bool]]
+    ) -> Tuple[Any, bool]:
+        """
+        Run a check, answering from the result cache when possible.
 
-        for citation in citations:
-            cit_id = citation.get('id', 'unknown')
-            result = self._verify_single_citation(citation)
-            results[cit_id] = result
+        Args:
+            cache_key: Check type and canonical value
+            value: Value to check
+            func: Check returning its result and whether that result is
+                definitive, rather than down to a timeout, connection error
+                or rate-limited or failing server
 
-        return results
+        Returns:
+            Tuple of (result, definitive); only definitive results are cached
+        """
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            # JSON turns the URL check's tuple into a list
+            return (tuple(cached) if isinstance(cached, list) else cached), True
+
+        result, definitive = func(value)
+        if definitive:
+            self._save_cache(cache_key, result)
+        return result, definitive
+
+    def _get_cached(self, cache_key: str) -> Any:
+        """Retrieve a cached check result if valid."""
+        if self._cache_db is None:
+            return None
+
+        with self._cache_lock:
+            row = self._cache_db.execute(
+                "SELECT ts, result FROM checks WHERE k = ?", (cache_key,)
+            ).fetchone()
+        if row is None or time.time() - row[0] > self.cache_ttl:
+            return None
 
-    def _verify_single_citation(self, citation: Dict) -> VerificationResult:
-        """Verify a single citation."""
+        try:
+            return orjson.loads(row[1]) if orjson is not None else json.loads(row[1])
+        except ValueError:
+            return None
+
+    def _save_cache(self, cache_key: str, result: Any):
+        """Save a check result to the cache."""
+        if self._cache_db is None:
+            return
+
+        raw = orjson.dumps(result) if orjson is not None else json.dumps(result).encode()
+        with self._cache_lock:
+            self._cache_db.execute(
+                "INSERT OR REPLACE INTO checks VALUES (?, ?, ?)",
+                (cache_key, time.time(), raw)
+            )
+
+    def _verify_single_citation(
+        self,
+        citation: Dict,
+        checks: Dict[str, Future],
+        checked_at: str
+    ) -> VerificationResult:
+        """Build a citation's verification result from its submitted checks."""
         cit_id = citation.get('id', 'unknown')
         notes = []
-        status = 'unverified'
 
         # Check URL accessibility
         url = citation.get('URL')
         url_accessible = False
+        archive_url = None
         if url:
-            url_accessible, url_note = self._check_url(url)
+            (url_accessible, url_note, archive_url), _ = checks['url'].result()
             if url_note:
                 notes.append(url_note)
 
@@ -112,9 +452,8 @@ class SourceVerifier:
         doi_valid = None
         doi = citation.get('DOI')
         if doi:
-            doi_valid = self._verify_doi(doi)
+            doi_valid, _ = checks['doi'].result()
             if doi_valid:
-                status = 'verified'
                 notes.append(f"DOI {doi} is valid")
             else:
                 notes.append(f"DOI {doi} could not be verified")
@@ -123,20 +462,12 @@ class SourceVerifier:
         pmid_valid = None
         pmid = citation.get('PMID')
         if pmid:
-            pmid_valid = self._verify_pmid(pmid)
+            pmid_valid, _ = checks['pmid'].result()
             if pmid_valid:
-                status = 'verified'
                 notes.append(f"PMID {pmid} is valid")
 
-        # Check for archive if URL is dead
-        archive_url = None
-        if url and not url_accessible:
-            archive_url = self._find_archive(url)
-            if archive_url:
-                notes.append(f"Archive found: {archive_url}")
-                status = 'archived'
-            else:
-                status = 'dead_link'
+        if archive_url:
+            notes.append(f"Archive found: {archive_url}")
 
         # Determine final status
         if doi_valid or pmid_valid:
@@ -145,8 +476,10 @@ class SourceVerifier:
             status = 'accessible'
         elif archive_url:
             status = 'archived'
-        elif url and not url_accessible:
+        elif url:
             status = 'dead_link'
+        else:
+            status = 'unverified'
 
         return VerificationResult(
             citation_id=cit_id,
@@ -155,83 +488,127 @@ class SourceVerifier:
             doi_valid=doi_valid,
             pmid_valid=pmid_valid,
             archive_available=archive_url,
+            last_checked=checked_at,
             notes=notes
         )
 
-    def _check_url(self, url: str) -> Tuple[bool, Optional[str]]:
-        """Check if URL is accessible."""
+    def _check_url_or_archive(
+        self,
+        url: str
+    ) -> Tuple[Tuple[bool, Optional[str], Optional[str]], bool]:
+        """Check if URL is accessible, looking for an archived copy if it is not."""
+        accessible, note, definitive = self._check_url(url)
+        archive_url = None
+        if not accessible:
+            archive_url, archive_definitive = self._find_archive(url)
+            definitive = definitive and archive_definitive
+        return (accessible, note, archive_url), definitive
+
+    def _check_url(self, url: str) -> Tuple[bool, Optional[str], bool]:
+        """Check if URL is accessible, and whether the answer is definitive."""
         try:
-            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
-            if response.status_code == 200:
-                return True, None
-            elif response.status_code == 403:
-                return False, "URL returns 403 (possibly paywalled)"
+            # A one-byte ranged GET rather than HEAD, which many servers
+            # refuse; the body is never read, only the status
+            with self.session.get(
+                url,
+                headers={'Range': 'bytes=0-0'},
+                timeout=self.timeout,
+                allow_redirects=True,
+                stream=True
+            ) as response:
+                pass
+            # Any success is live, as is 416: the range cannot be satisfied
+            # because the resource is empty
+            if 200 <= response.status_code < 300 or response.status_code == 416:
+                return True, None, True
+            # 404 and 410 are settled; other errors may be passing
+            definitive = response.status_code in (404, 410)
+            if response.status_code == 403:
+                return False, "URL returns 403 (possibly paywalled)", definitive
             elif response.status_code == 404:
-                return False, "URL returns 404 (not found)"
+                return False, "URL returns 404 (not found)", definitive
             else:
-                return False, f"URL returns {response.status_code}"
+                return False, f"URL returns {response.status_code}", definitive
+        except (
+            requests.exceptions.InvalidURL,
+            requests.exceptions.InvalidSchema,
+            requests.exceptions.MissingSchema
+        ) as e:
+            # A malformed URL stays malformed
+            return False, f"URL check failed: {str(e)[:50]}", True
         except requests.RequestException as e:
-            return False, f"URL check failed: {str(e)[:50]}"
+            return False, f"URL check failed: {str(e)[:50]}", False
 
-    def _verify_doi(self, doi: str) -> bool:
-        """Verify DOI exists via DOI.org API."""
+    def _verify_doi(self, doi: str) -> Tuple[bool, bool]:
+        """Verify DOI exists via DOI.org API, and whether the answer is definitive."""
         try:
-            # Clean DOI
-            doi = doi.replace("https://doi.org/", "").replace("http://doi.org/", "")
             response = self.session.get(
-                f"https://doi.org/{doi}",
+                f"https://doi.org/{_clean_doi(doi)}",
                 timeout=self.timeout,
                 allow_redirects=False
             )
-            # DOI.org returns 302 redirect for valid DOIs
-            return response.status_code in [200, 301, 302, 303]
+            # DOI.org returns 302 redirect for valid DOIs and 404 for unknown ones
+            if response.status_code in [200, 301, 302, 303]:
+                return True, True
+            return False, response.status_code == 404
         except requests.RequestException:
-            return False
+            return False, False
 
-    def _verify_pmid(self, pmid: str) -> bool:
-        """Verify PMID exists via NCBI API."""
+    def _verify_pmid(self, pmid: str) -> Tuple[bool, bool]:
+        """Verify PMID exists via NCBI API, and whether the answer is definitive."""
+        pmid = _clean_pmid(pmid)
         try:
             response = self.session.get(
                 self.PUBMED_API,
                 params={'db': 'pubmed', 'id': pmid, 'retmode': 'json'},
                 timeout=self.timeout
             )
-            data = response.json()
+            if response.status_code != 200:
+                return False, False
+            data = _json_body(response)
             # Check if result exists and isn't an error
-            result = data.get('result', {}).get(str(pmid), {})
-            return 'error' not in result
+            result = data.get('result', {}).get(pmid, {})
+            return 'error' not in result, True
         except (requests.RequestException, json.JSONDecodeError):
-            return False
+            return False, False
 
-    def _find_archive(self, url: str) -> Optional[str]:
-        """Try to find archived version of URL."""
+    def _find_archive(self, url: str) -> Tuple[Optional[str], bool]:
+        """Try to find archived version of URL, and whether the answer is definitive."""
         try:
             # Check Wayback Machine
             wayback_api = f"https://archive.org/wayback/available?url={url}"
             response = self.session.get(wayback_api, timeout=self.timeout)
-            data = response.json()
+            if response.status_code != 200:
+                return None, False
+            data = _json_body(response)
 
             snapshots = data.get('archived_snapshots', {})
             closest = snapshots.get('closest', {})
 
             if closest.get('available'):
-                return closest.get('url')
+                return closest.get('url'), True
+            return None, True
         except (requests.RequestException, json.JSONDecodeError):
-            pass
-
-        return None
+            return None, False
 
     def detect_inconsistencies(
         self,
         research_data: Dict,
-        external_sources: Optional[List[Dict]] = None
+        external_sources: Optional[List[Dict]] = None,
+        compare_workers: Optional[int] = None
     ) -> List[ConsistencyIssue]:
         """
         Detect inconsistencies within research data or against external sources.
 
+        Comparing titles against external sources is CPU-bound, so several
+        sources needing at least PARALLEL_COMPARE_MIN comparisons between
+        them are compared on the verifier's process pool.
+
         Args:
             research_data: The structured research output
             external_sources: Optional list of external data to compare against
+            compare_workers: Processes comparing external sources (None for
+                one per CPU, 1 to compare in this process)
 
         Returns:
             List of detected inconsistencies
@@ -250,49 +627,75 @@ class SourceVerifier:
 
         # Check against external sources if provided
         if external_sources:
-            for ext_source in external_sources:
-                ext_issues = self._compare_to_external(research_data, ext_source)
-                issues.extend(ext_issues)
+            citation_count = len(research_data.get('citations', []))
+            # Each citation is compared at most once per source
+            comparisons = sum(
+                min(citation_count, len(ext_source.get('citations', [])))
+                for ext_source in external_sources
+            )
+            workers = compare_workers or os.cpu_count() or 1
+            if (workers == 1 or len(external_sources) == 1
+                    or comparisons < self.PARALLEL_COMPARE_MIN):
+                for ext_source in external_sources:
+                    issues.extend(self._compare_to_external(research_data, ext_source))
+            else:
+                # Ship workers only the fields the comparison reads
+                citations = [
+                    {key: c.get(key) for key in ('id', 'DOI', 'URL', 'title')}
+                    for c in research_data.get('citations', [])
+                ]
+                for ext_issues in self._get_compare_pool(workers).map(
+                    _external_title_issues,
+                    repeat(citations),
+                    external_sources,
+                    repeat(self.TITLE_MATCH_THRESHOLD)
+                ):
+                    issues.extend(ext_issues)
 
         return issues
 
+    def _get_compare_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Get the verifier's title comparison process pool, starting it if needed."""
+        if self._compare_pool is None or self._compare_pool_workers != workers:
+            if self._compare_pool is not None:
+                self._compare_pool.shutdown()
+            self._compare_pool = ProcessPoolExecutor(max_workers=workers)
+            self._compare_pool_workers = workers
+        return self._compare_pool
+
     def _group_claims_by_topic(self, research_data: Dict) -> Dict[str, List[Dict]]:
         """Group claims by their apparent topic for consistency checking."""
-        claims_by_topic = {}
-
-        # Keywords to identify topics
-        topic_keywords = {
-            'education': ['degree', 'university', 'phd', 'bsc', 'graduated', 'thesis'],
-            'position': ['professor', 'director', 'member', 'faculty'],
-            'award': ['prize', 'award', 'fellow', 'honored'],
-            'date': ['19', '20', 'year', 'month']
-        }
+        claims_by_topic = defaultdict(list)
+        topic_res = _TOPIC_RES.items()
+        any_topic = _ANY_TOPIC_RE.search
 
         for section in research_data.get('sections', []):
+            heading = section.get('heading')
             for claim in section.get('claims', []):
-                text_lower = claim.get('text', '').lower()
-
-                for topic, keywords in topic_keywords.items():
-                    if any(kw in text_lower for kw in keywords):
-                        if topic not in claims_by_topic:
-                            claims_by_topic[topic] = []
-                        claims_by_topic[topic].append({
-                            'text': claim.get('text'),
-                            'section': section.get('heading'),
-                            'citations': claim.get('citation_ids', [])
-                        })
+                text = claim.get('text')
+                text_lower = (text or '').lower()
+                if not any_topic(text_lower):
+                    continue
+
+                # One entry per claim, shared by every topic it matches
+                entry = {
+                    'text': text,
+                    'section': heading,
+                    'citations': claim.get('citation_ids', [])
+                }
+                for topic, topic_re in topic_res:
+                    if topic_re.search(text_lower):
+                        claims_by_topic[topic].append(entry)
 
-        return claims_by_topic
+        return dict(claims_by_topic)
 
     def _check_claim_consistency(self, topic: str, claims: List[Dict]) -> Optional[ConsistencyIssue]:
         """Check if claims on the same topic are consistent."""
         # Extract dates mentioned
-        date_pattern = r'\b(19|20)\d{2}\b'
-
         dates_found = {}
         for claim in claims:
             text = claim.get('text', '')
-            dates = re.findall(date_pattern, text)
+            dates = _DATE_RE.findall(text)
             for date in dates:
                 if date not in dates_found:
                     dates_found[date] = []
@@ -304,10 +707,19 @@ class SourceVerifier:
         return None  # Simplified - full implementation would do deeper analysis
 
     def _compare_to_external(self, research_data: Dict, external: Dict) -> List[ConsistencyIssue]:
-        """Compare research data to external source."""
-        issues = []
-        # Implementation would compare key facts
-        return issues
+        """
+        Compare research citations to an external source's records of them.
+
+        Args:
+            research_data: The structured research output
+            external: {'source': name, 'citations': [CSL-JSON records]}
+
+        Returns:
+            List of title inconsistencies
+        """
+        return _external_title_issues(
+            research_data.get('citations', []), external, self.TITLE_MATCH_THRESHOLD
+        )
 
     def extract_uncertainty_flags(self, wikitext: str) -> List[UncertaintyFlag]:
         """
@@ -321,42 +733,25 @@ class SourceVerifier:
         """
         flags = []
 
-        # Common uncertainty templates
-        templates = {
-            r'\{\{citation needed\}\}': 'citation_needed',
-            r'\{\{cn\}\}': 'citation_needed',
-            r'\{\{fact\}\}': 'citation_needed',
-            r'\{\{disputed\}\}': 'disputed',
-            r'\{\{dubious\}\}': 'disputed',
-            r'\{\{or\}\}': 'original_research',
-            r'\{\{original research\}\}': 'original_research',
-            r'\{\{primary source[^}]*\}\}': 'primary_source',
-            r'\{\{unreliable source\}\}': 'unreliable_source',
-            r'\{\{update\}\}': 'outdated',
-            r'\{\{out of date\}\}': 'outdated',
-            r'\{\{when\}\}': 'vague_time',
-            r'\{\{who\}\}': 'vague_attribution',
-            r'\{\{peacock\}\}': 'peacock_language',
-            r'\{\{weasel\}\}': 'weasel_words'
-        }
-
-        for pattern, flag_type in templates.items():
-            for match in re.finditer(pattern, wikitext, re.IGNORECASE):
-                # Get surrounding context
-                start = max(0, match.start() - 100)
-                end = min(len(wikitext), match.end() + 100)
-                context = wikitext[start:end]
-
-                # Try to identify section
-                section_match = re.search(r'==+\s*([^=]+)\s*==+', wikitext[:match.start()])
-                section = section_match.group(1) if section_match else "Unknown"
-
-                flags.append(UncertaintyFlag(
-                    section=section.strip(),
-                    text=context.strip(),
-                    flag_type=flag_type,
-                    wikipedia_template=match.group(0)
-                ))
+        # A flag belongs to the last heading seen before it
+        section = "Unknown"
+        for match in _FLAG_SCAN_RE.finditer(wikitext):
+            kind = match.lastgroup
+            if kind == 'heading':
+                section = match.group('heading_text').strip()
+                continue
+
+            # Get surrounding context
+            start = max(0, match.start() - 100)
+            end = min(len(wikitext), match.end() + 100)
+            context = wikitext[start:end]
+
+            flags.append(UncertaintyFlag(
+                section=section,
+                text=context.strip(),
+                flag_type=kind,
+                wikipedia_template=match.group(0)
+            ))
 
         return flags
 
@@ -440,16 +835,72 @@ class SourceVerifier:
         }
 
 
+def _external_title_issues(
+    citations: List[Dict],
+    external: Dict,
+    threshold: float
+) -> List[ConsistencyIssue]:
+    """
+    Find citations whose title disagrees with an external source's record.
+
+    Citations are matched by DOI, else URL, and a title whose normalized
+    Levenshtein similarity to the external record falls below threshold is
+    reported. Module-level so process pool workers can run it.
+
+    Args:
+        citations: CSL-JSON citations from the research output
+        external: {'source': name, 'citations': [CSL-JSON records]}
+        threshold: Minimum similarity for titles to agree
+
+    Returns:
+        List of title inconsistencies
+    """
+    external_titles = {}
+    for record in external.get('citations', []):
+        key = (record.get('DOI') or record.get('URL') or '').lower()
+        if key and record.get('title'):
+            external_titles[key] = record['title']
+    if not external_titles:
+        return []
+
+    issues = []
+    source_name = external.get('source', 'external')
+    for citation in citations:
+        key = (citation.get('DOI') or citation.get('URL') or '').lower()
+        title = citation.get('title')
+        external_title = external_titles.get(key)
+        if not title or not external_title:
+            continue
+
+        # Skip the full comparison only when it could not affect the severity
+        similarity = _title_similarity(
+            _normalize_title(title), _normalize_title(external_title),
+            min(threshold, _MINOR_TITLE_SIMILARITY)
+        )
+        if similarity < threshold:
+            issues.append(ConsistencyIssue(
+                claim=title,
+                field='title',
+                sources=[
+                    {'source': citation.get('id', 'research'), 'value': title},
+                    {'source': source_name, 'value': external_title}
+                ],
+                severity='minor' if similarity >= _MINOR_TITLE_SIMILARITY else 'moderate'
+            ))
+
+    return issues
+
+
 if __name__ == "__main__":
     # Example usage
     verifier = SourceVerifier()
 
     # Test DOI verification
     print("Testing DOI verification...")
-    valid = verifier._verify_doi("10.1371/journal.pone.0028766")
+    valid, _ = verifier._verify_doi("10.1371/journal.pone.0028766")
     print(f"DOI 10.1371/journal.pone.0028766 valid: {valid}")
 
     # Test PMID verification
     print("\nTesting PMID verification...")
-    valid = verifier._verify_pmid("22163331")
+    valid, _ = verifier._verify_pmid("22163331")
     print(f"PMID 22163331 valid: {valid}")
@@ -6,13 +6,24 @@ Includes rate limiting, caching, and proper User-Agent handling.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import json
+import random
 import hashlib
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+from collections import defaultdict
+from datetime import datetime
 from typing import Optional, Dict, List, Any
 from pathlib import Path
 
+# Optional fast JSON encoder/parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class WikipediaClient:
     """Client for Wikipedia's MediaWiki Action API."""
@@ -23,12 +34,23 @@ class WikipediaClient:
     # Required by Wikipedia's API policy
     USER_AGENT = "WikipediaResearchSkill/1.0 (https://github.com/example/wiki-research; research@example.com)"
 
+    # Most titles the API accepts in one query for regular clients
+    MAX_TITLES_PER_QUERY = 50
+
+    # Keep-alive connections pooled per host, enough for concurrent fetches
+    POOL_MAXSIZE = 16
+
+    # Transient statuses (rate limited, overloaded) retried with backoff
+    RETRY_STATUSES = (429, 503)
+    MAX_RETRIES = 4
+
     def __init__(
         self,
         language: str = "en",
         cache_dir: Optional[str] = None,
         cache_ttl: int = 3600,
-        rate_limit: float = 1.0
+        rate_limit: float = 1.0,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize Wikipedia client.
@@ -38,66 +60,114 @@ class WikipediaClient:
             cache_dir: Directory for caching responses (None to disable)
             cache_ttl: Cache time-to-live in seconds
             rate_limit: Minimum seconds between requests
+            session: HTTP session to share with other clients (None to create
+                one, which close() then closes)
         """
         self.language = language
         self.api_url = self.API_TEMPLATE.format(lang=language)
         self.cache_dir = Path(cache_dir) if cache_dir else None
         self.cache_ttl = cache_ttl
+        self._cache_db = None
+        self._cache_lock = threading.Lock()
         self.rate_limit = rate_limit
         self._last_request = 0
+        self._rate_lock = threading.Lock()
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": self.USER_AGENT
-        })
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                "User-Agent": self.USER_AGENT
+            })
+            session.mount("https://", HTTPAdapter(pool_maxsize=self.POOL_MAXSIZE))
+        self.session = session
 
         if self.cache_dir:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_db = self._open_cache_db(self.cache_dir / "cache.sqlite")
+
+    def _open_cache_db(self, path: Path) -> sqlite3.Connection:
+        """Open the response cache database, dropping entries past their TTL."""
+        # Autocommit, shared across fetch threads under _cache_lock; WAL lets
+        # other processes using the same cache_dir read while one writes
+        db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS cache (k TEXT PRIMARY KEY, ts REAL, data BLOB)"
+        )
+        db.execute("DELETE FROM cache WHERE ts < ?", (time.time() - self.cache_ttl,))
+        return db
+
+    def close(self):
+        """Close the cache database, and the HTTP session if this client created it."""
+        if self._cache_db is not None:
+            with self._cache_lock:
+                self._cache_db.close()
+                self._cache_db = None
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def _rate_limit_wait(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request = time.time()
+        """Enforce rate limiting between requests (safe across threads)."""
+        with self._rate_lock:
+            elapsed = time.time() - self._last_request
+            if elapsed < self.rate_limit:
+                time.sleep(self.rate_limit - elapsed)
+            self._last_request = time.time()
 
     def _cache_key(self, params: Dict) -> str:
-        """Generate cache key from request parameters."""
-        param_str = json.dumps(params, sort_keys=True)
-        return hashlib.md5(param_str.encode()).hexdigest()
+        """Generate cache key from request parameters (BLAKE2b, 128-bit)."""
+        # Both encoders produce the same compact bytes, so keys are stable
+        # whether or not orjson is installed
+        if orjson is not None:
+            param_bytes = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        else:
+            param_bytes = json.dumps(
+                params, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+            ).encode()
+        return hashlib.blake2b(param_bytes, digest_size=16).hexdigest()
 
     def _get_cached(self, cache_key: str) -> Optional[Dict]:
         """Retrieve cached response if valid."""
-        if not self.cache_dir:
+        if self._cache_db is None:
             return None
 
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if not cache_file.exists():
+        with self._cache_lock:
+            row = self._cache_db.execute(
+                "SELECT ts, data FROM cache WHERE k = ?", (cache_key,)
+            ).fetchone()
+        if row is None:
             return None
 
-        try:
-            with open(cache_file, 'r') as f:
-                cached = json.load(f)
-
-            cached_time = datetime.fromisoformat(cached['_cached_at'])
-            if datetime.now() - cached_time > timedelta(seconds=self.cache_ttl):
-                return None
+        cached_at, raw = row
+        if time.time() - cached_at > self.cache_ttl:
+            return None
 
-            return cached['data']
-        except (json.JSONDecodeError, KeyError):
+        try:
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:
             return None
 
     def _save_cache(self, cache_key: str, data: Dict):
         """Save response to cache."""
-        if not self.cache_dir:
+        if self._cache_db is None:
             return
 
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        with open(cache_file, 'w') as f:
-            json.dump({
-                '_cached_at': datetime.now().isoformat(),
-                'data': data
-            }, f)
+        if orjson is not None:
+            raw = orjson.dumps(data)
+        else:
+            raw = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        with self._cache_lock:
+            self._cache_db.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                (cache_key, time.time(), raw)
+            )
 
     def _request(self, params: Dict, use_cache: bool = True) -> Dict:
         """
@@ -108,9 +178,11 @@ class WikipediaClient:
             use_cache: Whether to use cache
 
         Returns:
-            API response as dictionary
+            API response as dictionary (formatversion 2: page lists rather
+            than pageid maps, plain string values rather than '*' keys)
         """
         params['format'] = 'json'
+        params['formatversion'] = 2
 
         if use_cache:
             cache_key = self._cache_key(params)
@@ -118,17 +190,88 @@ class WikipediaClient:
             if cached:
                 return cached
 
-        self._rate_limit_wait()
+        for attempt in range(self.MAX_RETRIES + 1):
+            self._rate_limit_wait()
+            response = self.session.get(self.api_url, params=params)
+
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                break
+            time.sleep(self._retry_delay(response, attempt))
 
-        response = self.session.get(self.api_url, params=params)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content) if orjson is not None else response.json()
 
         if use_cache:
             self._save_cache(cache_key, data)
 
         return data
 
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying: Retry-After if given, else jittered backoff."""
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return float(retry_after)
+        return 2 ** attempt + random.random()
+
+    def _query_pages(
+        self,
+        titles: List[str],
+        params: Dict,
+        use_cache: bool = True
+    ) -> Dict[str, List[Dict]]:
+        """
+        Run a page query for several titles in batched requests.
+
+        Sends up to MAX_TITLES_PER_QUERY titles per request, follows
+        continuation responses, and maps title normalization and redirects
+        back to the titles asked for.
+
+        Args:
+            titles: Page titles
+            params: Query parameters other than titles
+            use_cache: Whether to use the response cache
+
+        Returns:
+            Dictionary mapping each title (in input order) that names an
+            existing page to its page objects, one per response the page
+            appeared in; other titles are omitted
+        """
+        # '|' separates titles in the query, so such titles cannot be batched
+        titles = [t for t in dict.fromkeys(titles) if t and '|' not in t]
+        results = {}
+
+        for i in range(0, len(titles), self.MAX_TITLES_PER_QUERY):
+            batch = titles[i:i + self.MAX_TITLES_PER_QUERY]
+            batch_params = dict(params, titles='|'.join(batch), redirects=1)
+
+            normalized = {}
+            redirects = {}
+            pages = defaultdict(list)
+
+            # Prop limits are shared by the whole batch, so long results are
+            # split across continuation responses
+            while True:
+                response = self._request(batch_params, use_cache=use_cache)
+                query = response.get('query', {})
+
+                normalized.update((n['from'], n['to']) for n in query.get('normalized', []))
+                redirects.update((r['from'], r['to']) for r in query.get('redirects', []))
+                for page in query.get('pages', []):
+                    if 'missing' not in page and 'invalid' not in page:
+                        pages[page['title']].append(page)
+
+                if 'continue' not in response:
+                    break
+                batch_params.update(response['continue'])
+
+            for title in batch:
+                resolved = normalized.get(title, title)
+                resolved = redirects.get(resolved, resolved)
+                if resolved in pages:
+                    results[title] = pages[resolved]
+
+        return results
+
     def search(
         self,
         query: str,
@@ -158,6 +301,23 @@ class WikipediaClient:
         response = self._request(params)
         return response.get('query', {}).get('search', [])
 
+    def resolve_titles(self, names: List[str]) -> Dict[str, str]:
+        """
+        Resolve names to existing article titles in batched queries.
+
+        Follows title normalization and redirects, sending up to
+        MAX_TITLES_PER_QUERY names per request.
+
+        Args:
+            names: Candidate article titles
+
+        Returns:
+            Dictionary mapping each name that names an existing article to
+            that article's title; other names are omitted
+        """
+        pages = self._query_pages(names, {'action': 'query'})
+        return {name: name_pages[0]['title'] for name, name_pages in pages.items()}
+
     def get_article(
         self,
         title: str,
@@ -170,12 +330,14 @@ class WikipediaClient:
         Args:
             title: Article title (use underscores for spaces)
             include_wikitext: Include raw wikitext for parsing
-            sections: Include section breakdown
+            sections: Include section breakdown (otherwise 'sections' is empty)
 
         Returns:
             Article data with content, metadata, sections
         """
-        props = ['text', 'categories', 'links', 'externallinks', 'sections', 'revid']
+        props = ['text', 'categories', 'links', 'externallinks', 'revid']
+        if sections:
+            props.append('sections')
         if include_wikitext:
             props.append('wikitext')
 
@@ -197,16 +359,85 @@ class WikipediaClient:
             'title': parse_data.get('title', title),
             'pageid': parse_data.get('pageid'),
             'revid': parse_data.get('revid'),
-            'html': parse_data.get('text', {}).get('*', ''),
-            'wikitext': parse_data.get('wikitext', {}).get('*', '') if include_wikitext else None,
-            'categories': [c['*'] for c in parse_data.get('categories', [])],
+            'html': parse_data.get('text', ''),
+            'wikitext': parse_data.get('wikitext', '') if include_wikitext else None,
+            'categories': [c['category'] for c in parse_data.get('categories', [])],
             'sections': parse_data.get('sections', []),
-            'links': [l['*'] for l in parse_data.get('links', []) if l.get('ns') == 0],
+            'links': [l['title'] for l in parse_data.get('links', []) if l.get('ns') == 0],
             'external_links': parse_data.get('externallinks', []),
             'url': f"https://{self.language}.wikipedia.org/wiki/{title}",
             'extracted_at': datetime.now().isoformat()
         }
 
+    def get_summary(self, title: str) -> Dict:
+        """
+        Get article metadata without its content.
+
+        Requests only the properties a summary needs, skipping the rendered
+        HTML that makes up most of a get_article response.
+
+        Args:
+            title: Article title (use underscores for spaces)
+
+        Returns:
+            Article data as from get_article, without html, wikitext and
+            external_links
+        """
+        params = {
+            'action': 'parse',
+            'page': title,
+            'prop': 'categories|links|sections|revid'
+        }
+
+        response = self._request(params)
+
+        if 'error' in response:
+            raise ValueError(f"Article not found: {title}")
+
+        parse_data = response.get('parse', {})
+
+        return {
+            'title': parse_data.get('title', title),
+            'pageid': parse_data.get('pageid'),
+            'revid': parse_data.get('revid'),
+            'categories': [c['category'] for c in parse_data.get('categories', [])],
+            'sections': parse_data.get('sections', []),
+            'links': [l['title'] for l in parse_data.get('links', []) if l.get('ns') == 0],
+            'url': f"https://{self.language}.wikipedia.org/wiki/{title}",
+            'extracted_at': datetime.now().isoformat()
+        }
+
+    def get_wikitexts(self, titles: List[str]) -> Dict[str, str]:
+        """
+        Get the current wikitext of several articles in batched queries.
+
+        Follows title normalization and redirects, sending up to
+        MAX_TITLES_PER_QUERY titles per request.
+
+        Args:
+            titles: Article titles
+
+        Returns:
+            Dictionary mapping each title (in input order) that names an
+            existing article to its wikitext; other titles are omitted
+        """
+        params = {
+            'action': 'query',
+            'prop': 'revisions',
+            'rvprop': 'content',
+            'rvslots': 'main'
+        }
+
+        wikitexts = {}
+        for title, pages in self._query_pages(titles, params).items():
+            for page in pages:
+                revisions = page.get('revisions')
+                if revisions:
+                    main = revisions[0].get('slots', {}).get('main', {})
+                    wikitexts[title] = main.get('content', '')
+
+        return wikitexts
+
     def get_article_text(self, title: str) -> str:
         """
         Get plain text extract of article.
@@ -226,9 +457,9 @@ class WikipediaClient:
         }
 
         response = self._request(params)
-        pages = response.get('query', {}).get('pages', {})
+        pages = response.get('query', {}).get('pages', [])
 
-        for page in pages.values():
+        for page in pages:
             return page.get('extract', '')
 
         return ''
@@ -243,10 +474,10 @@ class WikipediaClient:
         }
 
         response = self._request(params)
-        pages = response.get('query', {}).get('pages', {})
+        pages = response.get('query', {}).get('pages', [])
 
         categories = []
-        for page in pages.values():
+        for page in pages:
             for cat in page.get('categories', []):
                 # Remove "Category:" prefix
                 cat_name = cat.get('title', '').replace('Category:', '')
@@ -254,6 +485,32 @@ class WikipediaClient:
 
         return categories
 
+    def get_categories_batch(self, titles: List[str]) -> Dict[str, List[str]]:
+        """
+        Get the categories of several articles in batched queries.
+
+        Args:
+            titles: Article titles
+
+        Returns:
+            Dictionary mapping each title that names an existing article to
+            its category names (without the "Category:" prefix)
+        """
+        params = {
+            'action': 'query',
+            'prop': 'categories',
+            'cllimit': 500
+        }
+
+        return {
+            title: [
+                cat.get('title', '').replace('Category:', '')
+                for page in pages
+                for cat in page.get('categories', [])
+            ]
+            for title, pages in self._query_pages(titles, params).items()
+        }
+
     def get_links(self, title: str, namespace: int = 0) -> List[str]:
         """Get all links from an article."""
         params = {
@@ -265,15 +522,43 @@ class WikipediaClient:
         }
 
         response = self._request(params)
-        pages = response.get('query', {}).get('pages', {})
+        pages = response.get('query', {}).get('pages', [])
 
         links = []
-        for page in pages.values():
+        for page in pages:
             for link in page.get('links', []):
                 links.append(link.get('title', ''))
 
         return links
 
+    def get_links_batch(self, titles: List[str], namespace: int = 0) -> Dict[str, List[str]]:
+        """
+        Get all links from several articles in batched queries.
+
+        Args:
+            titles: Article titles
+            namespace: Namespace of linked pages to return (0 = articles)
+
+        Returns:
+            Dictionary mapping each title that names an existing article to
+            the titles it links to
+        """
+        params = {
+            'action': 'query',
+            'prop': 'links',
+            'plnamespace': namespace,
+            'pllimit': 500
+        }
+
+        return {
+            title: [
+                link.get('title', '')
+                for page in pages
+                for link in page.get('links', [])
+            ]
+            for title, pages in self._query_pages(titles, params).items()
+        }
+
     def get_backlinks(self, title: str, limit: int = 100) -> List[str]:
         """Get articles that link to this article."""
         params = {
@@ -299,15 +584,44 @@ class WikipediaClient:
         }
 
         response = self._request(params)
-        pages = response.get('query', {}).get('pages', {})
+        pages = response.get('query', {}).get('pages', [])
 
-        for page in pages.values():
+        for page in pages:
             revisions = page.get('revisions', [{}])
             if revisions:
                 return revisions[0]
 
         return {}
 
+    def get_revision_ids(self, titles: List[str]) -> Dict[str, int]:
+        """
+        Get the current revision ID of several articles in batched queries.
+
+        Bypasses the response cache so the IDs are always current. Follows
+        title normalization and redirects, sending up to MAX_TITLES_PER_QUERY
+        titles per request.
+
+        Args:
+            titles: Article titles
+
+        Returns:
+            Dictionary mapping each title that names an existing article to
+            its current revision ID; other titles are omitted
+        """
+        params = {
+            'action': 'query',
+            'prop': 'revisions',
+            'rvprop': 'ids'
+        }
+
+        revids = {}
+        for title, pages in self._query_pages(titles, params, use_cache=False).items():
+            for page in pages:
+                if page.get('revisions'):
+                    revids[title] = page['revisions'][0]['revid']
+
+        return revids
+
 
 class WikidataClient:
     """Client for Wikidata SPARQL queries."""
@@ -0,0 +1,140 @@
+"""Tests for source_verifier.
+
+Run from the skill directory with: python -m unittest discover -s tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import source_verifier  # noqa: E402
+from source_verifier import SourceVerifier  # noqa: E402
+
+
+class _RejectingSession:
+    """Session stand-in that rejects every URL the way requests does for malformed ones."""
+
+    def __init__(self):
+        self.headers = {}
+
+    def get(self, url, **kwargs):
+        raise requests.exceptions.InvalidURL(f"Invalid URL {url!r}")
+
+    head = get
+
+    def close(self):
+        pass
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+class _ScriptedSession:
+    """Session stand-in answering each GET with the next scripted status or exception."""
+
+    def __init__(self, outcomes):
+        self.headers = {}
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return _Response(outcome)
+
+    def close(self):
+        pass
+
+
+class CanonicalUrlTest(unittest.TestCase):
+    def test_canonical_form(self):
+        self.assertEqual(
+            source_verifier._canonical_url(' HTTP://Example.org?b=2&a=1#frag '),
+            'http://example.org/?a=1&b=2',
+        )
+
+    def test_malformed_url_falls_back_to_stripped_url(self):
+        self.assertEqual(
+            source_verifier._canonical_url(' http://[invalid/path '),
+            'http://[invalid/path',
+        )
+
+
+class TitleSimilarityTest(unittest.TestCase):
+    def test_length_ruled_out_returns_zero(self):
+        self.assertEqual(source_verifier._title_similarity('abcdefghij', 'abc', 0.9), 0.0)
+
+    def test_severity_graded_from_real_similarity(self):
+        issues = source_verifier._external_title_issues(
+            [{'id': 'c', 'DOI': '10.1/x', 'title': 'abcdefghij'}],
+            {'source': 'ext', 'citations': [{'DOI': '10.1/x', 'title': 'zyxwvuts'}]},
+            0.9,
+        )
+        self.assertEqual([issue.severity for issue in issues], ['moderate'])
+
+
+class VerifyCitationsTest(unittest.TestCase):
+    def test_malformed_url_is_reported_not_raised(self):
+        with SourceVerifier() as verifier:
+            verifier.session = _RejectingSession()
+            results = verifier.verify_citations([{'id': 'a', 'URL': 'http://[invalid/path'}])
+
+        self.assertEqual(list(results), ['a'])
+        self.assertFalse(results['a'].url_accessible)
+        self.assertTrue(any('URL check failed' in note for note in results['a'].notes))
+
+    def test_any_success_or_empty_range_is_accessible(self):
+        for outcome in (200, 204, 206, 416):
+            with self.subTest(outcome=outcome):
+                session = _ScriptedSession([outcome])
+                with SourceVerifier() as verifier:
+                    verifier.session = session
+                    results = verifier.verify_citations([{'id': 'a', 'URL': 'http://example.org/'}])
+
+                self.assertTrue(results['a'].url_accessible)
+                self.assertEqual(session.calls, 1)
+
+
+class CheckCacheTest(unittest.TestCase):
+    def _verify_doi_twice(self, outcomes):
+        """Verify one DOI in two passes; return both results, the request count and the cached value."""
+        session = _ScriptedSession(outcomes)
+        citations = [{'id': 'a', 'DOI': '10.1000/x'}]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with SourceVerifier(cache_dir=cache_dir) as verifier:
+                verifier.session = session
+                first = verifier.verify_citations(citations)['a'].doi_valid
+                second = verifier.verify_citations(citations)['a'].doi_valid
+                cached = verifier._get_cached('doi:10.1000/x')
+        return first, second, session.calls, cached
+
+    def test_transient_failures_are_retried_and_not_cached(self):
+        for outcome in (requests.ConnectionError('refused'), 429, 503):
+            with self.subTest(outcome=outcome):
+                self.assertEqual(
+                    self._verify_doi_twice([outcome, outcome]), (False, False, 2, None)
+                )
+
+    def test_definitive_answers_are_reused_and_cached(self):
+        for outcome, valid in ((302, True), (404, False)):
+            with self.subTest(outcome=outcome):
+                self.assertEqual(self._verify_doi_twice([outcome]), (valid, valid, 1, valid))
+
+
+if __name__ == '__main__':
+    unittest.main()